@@ -1,8 +1,183 @@
+from typing import Any, Dict, List, Tuple, Optional, Sequence
+
 from django.contrib import admin
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Case, When, IntegerField
+from django.contrib.admin.views.main import ORDER_VAR, SEARCH_VAR
 
-from django_typesense.models import TypesenseAPIKey
+from django_typesense.fields import BooleanField, DateField, TimeField, DateTimeField
+from django_typesense.collection import Collection
+from django_typesense.models import TypesenseAPIKey, TypesenseSynonym, TypesenseOverride
+from django_typesense.registry import get_collection
 
 
 @admin.register(TypesenseAPIKey)
 class TypesenseAPIKeyAdmin(admin.ModelAdmin):
     pass
+
+
+@admin.register(TypesenseSynonym)
+class TypesenseSynonymAdmin(admin.ModelAdmin):
+    list_filter = ("collection",)
+    search_fields = ("synonym_id", "root", "synonyms")
+    list_display = ("synonym_id", "collection", "root", "synonyms")
+
+
+@admin.register(TypesenseOverride)
+class TypesenseOverrideAdmin(admin.ModelAdmin):
+    list_filter = ("collection", "match")
+    search_fields = ("override_id", "query")
+    list_display = ("override_id", "collection", "query", "match")
+
+
+# Dates & times are indexed as epochs, which can't be filtered on in the database.
+FACET_FIELD_TYPES = ("string", "int32", "int64", "float", "bool")
+
+
+def facet_filter(field_name: str) -> type:
+    """
+    Returns a list filter for a faceted (string, number or bool) field of the
+    model admin's Collection. The choices (with their counts) come from
+    Typesense and take the current changelist search into account.
+    """
+
+    class TypesenseFacetFilter(admin.SimpleListFilter):
+        title = field_name.replace("_", " ")
+        parameter_name = field_name
+
+        def __init__(self, request, params, model, model_admin):
+            self.field = model_admin.get_typesense_collection()._get_fields_dict()[field_name]
+
+            assert self.field.field_type in FACET_FIELD_TYPES and not isinstance(
+                self.field, (DateField, TimeField, DateTimeField)
+            ), f"Can't facet on the {self.field.__class__.__name__} field {field_name}."
+
+            super().__init__(request, params, model, model_admin)
+
+        def lookups(self, request, model_admin) -> List[Tuple[str, str]]:
+            return [
+                (count["value"], f"{count['value']} ({count['count']})")
+                for count in model_admin.get_typesense_facet_counts(request).get(field_name, [])
+            ]
+
+        def queryset(self, request, queryset):
+            value: Optional[Any] = self.value()
+
+            if value is None:
+                return queryset
+
+            if isinstance(self.field, BooleanField):
+                value = value == "true"
+
+            lookup = (self.field.source or field_name).replace(".", "__")
+            return queryset.filter(**{lookup: value})
+
+    return TypesenseFacetFilter
+
+
+class TypesenseSearchMixin:
+    """
+    ModelAdmin mixin that sends the changelist search box to Typesense instead
+    of running `icontains` queries against the database. The ids Typesense
+    returns become a `pk__in` filter, ordered by relevance unless a column was
+    picked for sorting. Only the first `typesense_max_hits` hits are shown.
+
+    `typesense_query_by` defaults to every indexed string field of the
+    registered Collection. The fields in `typesense_facets` are added to
+    the list filters, with their counts from Typesense - fetched for all of
+    them with a single search per changelist view.
+
+    For sharded Collections, override `get_typesense_tenant` to tell which
+    tenant's shard to search.
+    """
+
+    typesense_query_by: Optional[Sequence[str]] = None
+    typesense_facets: Sequence[str] = ()
+    typesense_max_facet_values: int = 20
+    typesense_max_hits: int = 250
+
+    def get_typesense_collection(self) -> Collection:
+        collection = get_collection(self.model)
+
+        assert collection is not None, f"No Collection is registered for {self.model.__name__}."
+
+        return collection
+
+    def get_typesense_tenant(self, request) -> Optional[Any]:
+        """
+        The tenant to search for, required if the Collection is sharded -
+        e.g. the organization of `request.user`.
+        """
+
+        return None
+
+    def search_typesense(self, request, params: Dict[str, Any]) -> Dict[str, Any]:
+        collection = self.get_typesense_collection()
+        tenant = self.get_typesense_tenant(request)
+
+        if collection.is_sharded() and tenant is None:
+            raise ImproperlyConfigured(
+                f"{collection.__class__.__name__} is sharded, please override "
+                f"{self.__class__.__name__}.get_typesense_tenant to pick the tenant to search."
+            )
+
+        return collection.search(params, tenant=tenant)
+
+    def get_typesense_query_by(self) -> List[str]:
+        if self.typesense_query_by is not None:
+            return list(self.typesense_query_by)
+
+        return [
+            name
+            for name, field in self.get_typesense_collection()._get_fields_dict().items()
+            if field.field_type == "string" and field.index
+        ]
+
+    def get_typesense_facet_counts(self, request) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        The facet counts of every field in `typesense_facets` by field name,
+        cached on the request so the list filters share one search.
+        """
+
+        if not hasattr(request, "_typesense_facet_counts"):
+            result = self.search_typesense(
+                request,
+                {
+                    "q": request.GET.get(SEARCH_VAR) or "*",
+                    "query_by": ",".join(self.get_typesense_query_by()),
+                    "facet_by": ",".join(self.typesense_facets),
+                    "max_facet_values": self.typesense_max_facet_values,
+                    "per_page": 0,
+                },
+            )
+            request._typesense_facet_counts = {
+                facet["field_name"]: facet["counts"] for facet in result.get("facet_counts", [])
+            }
+
+        return request._typesense_facet_counts
+
+    def get_list_filter(self, request):
+        return [*super().get_list_filter(request), *(facet_filter(name) for name in self.typesense_facets)]
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+
+        result = self.search_typesense(
+            request,
+            {
+                "q": search_term,
+                "query_by": ",".join(self.get_typesense_query_by()),
+                "include_fields": "id",
+                "per_page": self.typesense_max_hits,
+            },
+        )
+
+        ids = [hit["document"]["id"] for hit in result["hits"]]
+        queryset = queryset.filter(pk__in=ids)
+
+        if ids and ORDER_VAR not in request.GET:
+            rank = Case(*(When(pk=pk, then=position) for position, pk in enumerate(ids)), output_field=IntegerField())
+            queryset = queryset.annotate(typesense_rank=rank).order_by("typesense_rank")
+
+        return queryset, False
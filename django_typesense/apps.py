@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
 
 
 class DjangoTypesenseConfig(AppConfig):
@@ -8,4 +9,7 @@ class DjangoTypesenseConfig(AppConfig):
     def ready(self) -> None:
         import django_typesense.signals  # noqa
 
+        # Collections are registered as their `index` modules are imported.
+        autodiscover_modules("index")
+
         return super().ready()
@@ -0,0 +1,121 @@
+import time
+import threading
+from typing import Any, List, Callable, TypeVar
+
+import httpx
+from typesense.exceptions import Timeout, ServerError, HTTPStatus0Error, ServiceUnavailable
+
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from django_typesense.routing import REQUEST_ERRORS
+
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling Typesense while the circuit breaker is open.
+    """
+
+
+# Typesense being unreachable or down - the writes that fail with these
+# can be kept for later instead of raising.
+OUTAGE_ERRORS = (CircuitOpenError, ServerError, ServiceUnavailable, HTTPStatus0Error, Timeout, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """
+    Stops calling Typesense after `failure_threshold` consecutive node
+    failures so writes fail fast instead of each one waiting out the full
+    `connection_timeout_seconds` x `num_retries` budget. After
+    `reset_timeout` seconds a single trial call is let through (half-open)
+    and its outcome decides whether the breaker closes or opens again.
+
+    Errors caused by the request itself (404, 400, ...) don't count as failures.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self._state: str = self.CLOSED
+        self._lock = threading.Lock()
+        self._on_close: List[Callable[[], Any]] = []
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    def on_close(self, callback: Callable[[], Any]) -> None:
+        """
+        Registers a callback to run whenever a call succeeds after failures.
+        """
+        self._on_close.append(callback)
+
+    def _before_call(self) -> None:
+        with self._lock:
+            state = self.state
+
+            if state == self.OPEN:
+                raise CircuitOpenError("Typesense circuit breaker is open.")
+
+            if state == self.HALF_OPEN:
+                # Let exactly one trial call through - everybody
+                # else keeps failing fast until it has finished.
+                self._state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def _record_success(self) -> None:
+        with self._lock:
+            recovered = self._state != self.CLOSED or self.failures > 0
+            self.failures = 0
+            self._state = self.CLOSED
+
+        if recovered:
+            for callback in self._on_close:
+                callback()
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+            if self._state != self.CLOSED or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        self._before_call()
+
+        try:
+            result = func(*args, **kwargs)
+        except REQUEST_ERRORS:
+            self._record_success()
+            raise
+        except Exception:
+            self._record_failure()
+            raise
+
+        self._record_success()
+        return result
+
+
+def _make_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_threshold=getattr(settings, "DJANGO_TYPESENSE_BREAKER_FAILURE_THRESHOLD", 5),
+        reset_timeout=getattr(settings, "DJANGO_TYPESENSE_BREAKER_RESET_SECONDS", 30.0),
+    )
+
+
+breaker: CircuitBreaker = SimpleLazyObject(_make_breaker)
+
+__all__ = ["breaker", "CircuitBreaker", "CircuitOpenError"]
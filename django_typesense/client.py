@@ -1,9 +1,30 @@
+from typing import Any, Dict
+
 from typesense import Client
 
 from django.conf import settings
 from django.utils.functional import SimpleLazyObject
 
 
+def get_client_config(**overrides) -> Dict[str, Any]:
+    """
+    Builds the Typesense client configuration from the Django settings.
+    Any keyword arguments override the matching configuration keys.
+    """
+
+    config = {
+        "nodes": settings.TYPESENSE_NODES,
+        "api_key": settings.TYPESENSE_ADMIN_API_KEY,
+        "num_retries": getattr(settings, "TYPESENSE_NUM_RETRIES", 3),
+        "retry_interval_seconds": getattr(settings, "TYPESENSE_RETRY_INTERVAL_SECONDS", 1.0),
+        "connection_timeout_seconds": getattr(settings, "TYPESENSE_CONNECTION_TIMEOUT_SECONDS", 3.0),
+        "healthcheck_interval_seconds": getattr(settings, "TYPESENSE_HEALTHCHECK_INTERVAL_SECONDS", 60),
+    }
+    config.update(overrides)
+
+    return config
+
+
 class LazyTypesenseClient(Client):
     """
     TypesenseClient is a lazy singleton class that provides a Typesense client
@@ -12,21 +33,30 @@ class LazyTypesenseClient(Client):
     """
 
     def __init__(self):
-        super().__init__(
-            {
-                "nodes": settings.TYPESENSE_NODES,
-                "api_key": settings.TYPESENSE_ADMIN_API_KEY,
-                "num_retries": getattr(settings, "TYPESENSE_NUM_RETRIES", 3),
-                "retry_interval_seconds": getattr(settings, "TYPESENSE_RETRY_INTERVAL_SECONDS", 1.0),
-                "connection_timeout_seconds": getattr(settings, "TYPESENSE_CONNECTION_TIMEOUT_SECONDS", 3.0),
-                "healthcheck_interval_seconds": getattr(settings, "TYPESENSE_HEALTHCHECK_INTERVAL_SECONDS", 60),
-            }
-        )
+        super().__init__(get_client_config())
 
     def __call__(self) -> Client:
         return self
 
 
+def _make_import_client() -> Client:
+    # Every request of this client carries the header, so it only sends imports.
+    return Client(get_client_config(additional_headers={"Content-Encoding": "gzip"}))
+
+
+def _make_read_router():
+    from django_typesense.routing import ReadRouter
+
+    return ReadRouter(settings.TYPESENSE_NODES)
+
+
 client: Client = SimpleLazyObject(LazyTypesenseClient)
 
-__all__ = ["client"]
+# Bulk imports with `DJANGO_TYPESENSE_GZIP_IMPORTS = True` send gzipped bodies.
+import_client: Client = SimpleLazyObject(_make_import_client)
+
+# Searches go through the read router which prefers the fastest healthy
+# node (and optionally hedges). Everything else keeps using `client`.
+read_router = SimpleLazyObject(_make_read_router)
+
+__all__ = ["client", "import_client", "read_router", "get_client_config"]
@@ -1,14 +1,28 @@
 import abc
+import gzip
+import zlib
+import itertools
 from functools import cache
-from typing import Any, Set, List, Type, Dict, Optional
+from typing import Any, Set, List, Type, Dict, Tuple, Callable, Iterable, Optional
 
-from django.db.models import Model
+from typesense.exceptions import ObjectNotFound, ObjectAlreadyExists
 
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models import DEFERRED, Q, Field, Model, QuerySet
+
+from django_typesense.breaker import OUTAGE_ERRORS, breaker
+from django_typesense.encoders import BaseEncoder, get_encoder
+from django_typesense.client import client, read_router, import_client
 from django_typesense.fields import BaseField, TypesenseFieldType
+from django_typesense.fields.misc import GeoPointField
 from django_typesense.fields.number import LongField, FloatField, IntegerField
 
 
 NameFieldDict = Dict[str, TypesenseFieldType]
+Document = Dict[str, Any]
 
 
 class Collection(abc.ABC):
@@ -51,7 +65,7 @@ class Collection(abc.ABC):
 
         return token_separators
 
-    def to_typesense_schema(self) -> Dict[str, Any]:
+    def to_typesense_schema(self, shard: Optional[str] = None) -> Dict[str, Any]:
         collection_name = self.Meta.name
         class_name = self.__class__.__name__
 
@@ -72,7 +86,7 @@ class Collection(abc.ABC):
         assert len(typesense_fields) > 0, f"Collection {class_name} has no fields. Please add at least one field."
 
         schema = {
-            "name": collection_name,
+            "name": self.get_collection_name(shard),
             "fields": typesense_fields,
         }
 
@@ -101,6 +115,721 @@ class Collection(abc.ABC):
 
         return schema
 
+    def get_queryset(self) -> QuerySet:
+        queryset = self.Meta.model._default_manager.all()
+        index_filter: Optional[Q] = getattr(self.Meta, "filter", None)
+
+        return queryset if index_filter is None else queryset.filter(index_filter)
+
+    def matches(self, instance: Model) -> bool:
+        """
+        Whether the instance belongs in the index according to `Meta.filter`.
+        Checked in the database with a primary key lookup.
+        """
+
+        if getattr(self.Meta, "filter", None) is None:
+            return True
+
+        return self.get_queryset().filter(pk=instance.pk).exists()
+
+    def is_sharded(self) -> bool:
+        return getattr(self.Meta, "shard_by", None) is not None
+
+    @cache
+    def _get_shard_field(self) -> Field:
+        return self.Meta.model._meta.get_field(self.Meta.shard_by)
+
+    def get_tenant(self, instance: Model) -> Any:
+        return getattr(instance, self._get_shard_field().attname)
+
+    def get_shard(self, tenant: Any) -> str:
+        """
+        The shard a tenant's documents live in - its entry in `Meta.shard_placement`,
+        else one of `Meta.shards` hashed shards if set, else a shard of its own.
+        """
+
+        placement: Dict[Any, Any] = getattr(self.Meta, "shard_placement", None) or {}
+        shards: Optional[int] = getattr(self.Meta, "shards", None)
+
+        if tenant in placement:
+            return str(placement[tenant])
+
+        if shards:
+            return str(zlib.crc32(str(tenant).encode()) % shards)
+
+        return str(tenant)
+
+    def get_collection_name(self, shard: Optional[str] = None) -> str:
+        if not self.is_sharded():
+            return self.Meta.name
+
+        assert shard is not None, f"Please pass a shard for the sharded {self.__class__.__name__} Collection."
+
+        return f"{self.Meta.name}__{shard}"
+
+    def get_collection_name_for(self, instance: Model) -> str:
+        if not self.is_sharded():
+            return self.Meta.name
+
+        return self.get_collection_name(self.get_shard(self.get_tenant(instance)))
+
+    def get_shards(self, refresh: bool = False) -> List[str]:
+        """
+        All the shards of a sharded collection. The hashed & explicitly placed
+        shards are known upfront, per-tenant shards are looked up in Typesense.
+        That lookup is cached for `DJANGO_TYPESENSE_SHARD_CACHE_SECONDS`.
+        """
+
+        placement: Dict[Any, Any] = getattr(self.Meta, "shard_placement", None) or {}
+        shards: Optional[int] = getattr(self.Meta, "shards", None)
+
+        known = {str(shard) for shard in placement.values()}
+
+        if shards:
+            return sorted(known | {str(shard) for shard in range(shards)})
+
+        cache_key = f"django_typesense:shards:{self.Meta.name}"
+        existing: Optional[List[str]] = None if refresh else django_cache.get(cache_key)
+
+        if existing is None:
+            prefix = f"{self.Meta.name}__"
+            existing = [
+                collection["name"][len(prefix) :]
+                for collection in client.collections.retrieve()
+                if collection["name"].startswith(prefix)
+            ]
+            django_cache.set(cache_key, existing, getattr(settings, "DJANGO_TYPESENSE_SHARD_CACHE_SECONDS", 300))
+
+        return sorted(known | set(existing))
+
+    def get_tenants_by_shard(self, queryset: Optional[QuerySet] = None) -> Dict[str, List[Any]]:
+        queryset = self.get_queryset() if queryset is None else queryset
+        tenants = queryset.order_by().values_list(self._get_shard_field().attname, flat=True).distinct()
+        tenants_by_shard: Dict[str, List[Any]] = {}
+
+        for tenant in tenants:
+            tenants_by_shard.setdefault(self.get_shard(tenant), []).append(tenant)
+
+        return tenants_by_shard
+
+    def _shares_shards(self) -> bool:
+        return bool(getattr(self.Meta, "shards", None) or getattr(self.Meta, "shard_placement", None))
+
+    def _scope_params(self, params: Dict[str, Any], tenant: Any) -> Dict[str, Any]:
+        """
+        Restricts the search params to a tenant. Needed when shards can hold
+        more than one tenant (hashed or explicit placement), which requires
+        the shard key to be indexed.
+        """
+
+        shard_field = self._get_shard_field()
+
+        for name, field in self._get_fields_dict().items():
+            if field.get_sources(name)[0] in (shard_field.name, shard_field.attname):
+                value = f"`{tenant}`" if field.field_type == "string" else tenant
+                clause = f"{name}:={value}"
+                existing = params.get("filter_by")
+                return {**params, "filter_by": f"({existing}) && {clause}" if existing else clause}
+
+        if self._shares_shards():
+            raise ValueError(
+                f"Shards of the {self.__class__.__name__} Collection hold more than one tenant, "
+                f"please index the '{shard_field.name}' field to restrict searches to a tenant."
+            )
+
+        return params
+
+    def generate_scoped_search_key(
+        self, search_key: str, tenant: Any, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """
+        Returns the name of the tenant's shard collection along with a scoped
+        search key (derived from `search_key`) restricted to the tenant.
+
+        The scoped key can search every collection `search_key` can - create
+        the parent key for the shard's collection only (not `*` or the other
+        shards), or a tenant can read other shards with it.
+        """
+
+        assert self.is_sharded(), f"{self.__class__.__name__} Collection isn't sharded."
+
+        scoped_params = self._scope_params(dict(params or {}), tenant)
+        collection_name = self.get_collection_name(self.get_shard(tenant))
+
+        return collection_name, client.keys.generate_scoped_search_key(search_key, scoped_params)
+
+    def create_collection(self, shard: Optional[str] = None, recreate: bool = False) -> None:
+        collection_name = self.get_collection_name(shard)
+
+        if recreate:
+            try:
+                client.collections[collection_name].delete()
+            except ObjectNotFound:
+                pass
+
+        try:
+            client.collections.create(self.to_typesense_schema(shard))
+            created = True
+        except ObjectAlreadyExists:
+            created = False
+
+        if self.is_sharded():
+            django_cache.delete(f"django_typesense:shards:{self.Meta.name}")
+
+        if created:
+            # A new (or recreated) collection has no synonyms & overrides -
+            # shards get the ones stored under the name of the Collection.
+            from django_typesense.curation import push_curations
+
+            push_curations(collection_name, self.Meta.name)
+
+    def to_document(
+        self, instance: Model, field_names: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()
+    ) -> Document:
+        """
+        Serializes a model instance into a Typesense document. Every field
+        reads its value with `BaseField.value_from_instance`.
+
+        With `field_names` only those fields are serialized - a partial
+        document for the `update` action, where missing values are sent
+        as nulls so that Typesense clears them. The fields in `exclude`
+        are left out (bulk imports serialize those in batch).
+        """
+
+        document: Document = {"id": str(instance.pk)}
+        fields = self._get_fields_dict()
+        partial = field_names is not None
+
+        for name in fields if field_names is None else field_names:
+            if name in exclude:
+                continue
+
+            field = fields[name]
+            value = field.value_from_instance(instance, name)
+
+            if field.index_empty_values:
+                document[f"is_{name}_null"] = value is None
+
+            if value is None:
+                # Leave the key out - fine for optional fields and Typesense
+                # reports the document as failed for required ones.
+                if partial:
+                    document[name] = None
+                continue
+
+            document[name] = field.from_value(value)
+
+        return document
+
+    @cache
+    def _get_tracked_fields(self) -> Dict[str, Optional[Tuple[Field, ...]]]:
+        """
+        Maps every field name to the concrete model fields its value is read
+        from, or to None if it can't be tracked (callables, properties, ...).
+        Dotted sources are tracked by their first hop, so a change of
+        `author.name` is only noticed when `author_id` changes.
+        """
+
+        opts = self.Meta.model._meta
+        tracked: Dict[str, Optional[Tuple[Field, ...]]] = {}
+
+        for name, field in self._get_fields_dict().items():
+            try:
+                model_fields = tuple(opts.get_field(source.split(".")[0]) for source in field.get_sources(name))
+            except FieldDoesNotExist:
+                tracked[name] = None
+                continue
+
+            concrete = all(model_field.concrete for model_field in model_fields)
+            tracked[name] = model_fields if concrete else None
+
+        return tracked
+
+    @cache
+    def _get_filter_fields(self) -> Optional[Tuple[Field, ...]]:
+        """
+        The concrete model fields `Meta.filter` looks at (by their first hop),
+        or None if it can't be tracked - e.g. when it uses expressions.
+        """
+
+        opts = self.Meta.model._meta
+        model_fields: List[Field] = []
+
+        def collect(q: Q) -> bool:
+            for child in q.children:
+                if isinstance(child, Q):
+                    if not collect(child):
+                        return False
+                elif isinstance(child, tuple):
+                    name = child[0].split(LOOKUP_SEP)[0]
+                    model_field = opts.pk if name == "pk" else opts.get_field(name)
+
+                    if not model_field.concrete:
+                        return False
+
+                    model_fields.append(model_field)
+                else:
+                    return False
+
+            return True
+
+        return tuple(model_fields) if collect(self.Meta.filter) else None
+
+    def snapshot(self, instance: Model) -> Dict[str, Any]:
+        """
+        The raw values of the model fields the indexed fields are read from,
+        as they were loaded. Cheap enough to take on every `post_init`.
+        """
+
+        values = instance.__dict__
+        sources = list(self._get_tracked_fields().values())
+
+        if getattr(self.Meta, "filter", None) is not None:
+            sources.append(self._get_filter_fields())
+
+        if self.is_sharded():
+            sources.append((self._get_shard_field(),))
+
+        return {
+            model_field.attname: values.get(model_field.attname, DEFERRED)
+            for model_fields in sources
+            if model_fields is not None
+            for model_field in model_fields
+        }
+
+    @staticmethod
+    def _sources_changed(
+        model_fields: Tuple[Field, ...],
+        values: Dict[str, Any],
+        snapshot: Dict[str, Any],
+        update_fields: Optional[Iterable[str]],
+    ) -> bool:
+        if update_fields is not None and not any(
+            model_field.name in update_fields or model_field.attname in update_fields for model_field in model_fields
+        ):
+            return False
+
+        for model_field in model_fields:
+            previous = snapshot.get(model_field.attname, DEFERRED)
+
+            if previous is DEFERRED or previous != values.get(model_field.attname, DEFERRED):
+                return True
+
+        return False
+
+    def get_changed_fields(
+        self, instance: Model, snapshot: Dict[str, Any], update_fields: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Returns the names of the fields whose source changed since `snapshot`
+        was taken, among the fields whose source is one of `update_fields`
+        (if given). A source without a snapshot value counts as changed, and
+        untracked fields are always considered changed.
+        """
+
+        values = instance.__dict__
+
+        return [
+            name
+            for name, model_fields in self._get_tracked_fields().items()
+            if model_fields is None or self._sources_changed(model_fields, values, snapshot, update_fields)
+        ]
+
+    def search(self, params: Dict[str, Any], tenant: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Searches the collection through the read router, which picks the
+        fastest healthy node (see `django_typesense.routing.ReadRouter`).
+        Sharded collections need the `tenant` to route the search to its shard.
+        """
+
+        if not self.is_sharded():
+            return read_router.search(self.Meta.name, params)
+
+        assert tenant is not None, f"Please pass the tenant to search the sharded {self.__class__.__name__} Collection."
+
+        return read_router.search(self.get_collection_name(self.get_shard(tenant)), self._scope_params(params, tenant))
+
+    def _write(
+        self, collection_name: str, action: str, documents: List[Document], func: Callable[..., Any], *args
+    ) -> Any:
+        """
+        Calls `func` through the circuit breaker. If Typesense can't be reached
+        (or the breaker is open) the `documents` are appended to the spill log
+        for a later replay and None is returned - unless no spill log is
+        configured, in which case the error is raised. Any other error is
+        raised as well.
+        """
+
+        try:
+            return breaker.call(func, *args)
+        except OUTAGE_ERRORS:
+            # Imported here as the spill log is POSIX only.
+            from django_typesense.spill import get_spill_log
+
+            spill_log = get_spill_log()
+
+            if spill_log is None:
+                raise
+
+            spill_log.append(collection_name, action, documents)
+
+    def upsert_document(self, instance: Model, collection_name: Optional[str] = None) -> None:
+        document = self.to_document(instance)
+        collection_name = collection_name or self.get_collection_name_for(instance)
+        upsert = client.collections[collection_name].documents.upsert
+
+        try:
+            self._write(collection_name, "upsert", [document], upsert, document)
+        except ObjectNotFound:
+            if not self.is_sharded():
+                raise
+
+            # The first document of a new shard - create it & try again.
+            self.create_collection(collection_name[len(self.Meta.name) + 2 :])
+            self._write(collection_name, "upsert", [document], upsert, document)
+
+    def update_document(
+        self, instance: Model, field_names: Iterable[str], collection_name: Optional[str] = None
+    ) -> None:
+        document = self.to_document(instance, field_names)
+        document_id = document["id"]
+        collection_name = collection_name or self.get_collection_name_for(instance)
+
+        try:
+            self._write(
+                collection_name,
+                "update",
+                [document],
+                client.collections[collection_name].documents[document_id].update,
+                document,
+            )
+        except ObjectNotFound:
+            # Never indexed (or lost since) - send the whole thing.
+            self.upsert_document(instance, collection_name)
+
+    def sync(self, instance: Model, created: bool = False, update_fields: Optional[Iterable[str]] = None) -> None:
+        """
+        Syncs a saved instance. New instances are upserted, existing ones only
+        get the fields that changed sent as a partial `update` - and nothing
+        at all is sent if none of the indexed fields changed.
+
+        With a `Meta.filter`, instances that don't match it are left out of
+        the index and removed from it once they stop matching. The database
+        is only asked when the instance is new or something it would affect
+        changed.
+        """
+
+        snapshot: Optional[Dict[str, Any]] = getattr(instance, "_typesense_snapshot", None)
+        filtered = getattr(self.Meta, "filter", None) is not None
+        collection_name = self._get_saved_collection_name(instance, snapshot or {}, update_fields)
+
+        if created:
+            if self.matches(instance):
+                self.upsert_document(instance, collection_name)
+        elif snapshot is None and update_fields is None:
+            if self.matches(instance):
+                self.upsert_document(instance, collection_name)
+            else:
+                self.delete_document(instance.pk, collection_name)
+        elif self._moved_shards(instance, snapshot or {}, update_fields):
+            # The tenant changed - take the document out of its old shard.
+            previous_tenant = (snapshot or {})[self._get_shard_field().attname]
+            self.delete_document(instance.pk, self.get_collection_name(self.get_shard(previous_tenant)))
+
+            if self.matches(instance):
+                self.upsert_document(instance, collection_name)
+        else:
+            snapshot = snapshot or {}
+            filter_fields = self._get_filter_fields() if filtered else ()
+            changed = self.get_changed_fields(instance, snapshot, update_fields)
+
+            if filter_fields is None or (
+                filter_fields and self._sources_changed(filter_fields, instance.__dict__, snapshot, update_fields)
+            ):
+                # It may have just started (or stopped) matching.
+                if self.matches(instance):
+                    self.upsert_document(instance, collection_name)
+                else:
+                    self.delete_document(instance.pk, collection_name)
+            elif changed and self.matches(instance):
+                self.update_document(instance, changed, collection_name)
+
+        new_snapshot = self.snapshot(instance)
+
+        if snapshot and update_fields is not None:
+            # Whatever wasn't saved still has its old value in the index.
+            saved = {f.attname for f in instance._meta.concrete_fields if {f.name, f.attname} & set(update_fields)}
+            new_snapshot = {
+                attname: value if attname in saved else snapshot.get(attname, DEFERRED)
+                for attname, value in new_snapshot.items()
+            }
+
+        instance._typesense_snapshot = new_snapshot
+
+    def _get_saved_tenant(
+        self, instance: Model, snapshot: Dict[str, Any], update_fields: Optional[Iterable[str]]
+    ) -> Any:
+        """
+        The tenant as it is in the database - a tenant change that was left
+        out of `update_fields` was never saved.
+        """
+
+        shard_field = self._get_shard_field()
+
+        if update_fields is None or {shard_field.name, shard_field.attname} & set(update_fields):
+            return self.get_tenant(instance)
+
+        tenant = snapshot.get(shard_field.attname, DEFERRED)
+        return self.get_tenant(instance) if tenant is DEFERRED else tenant
+
+    def _get_saved_collection_name(
+        self, instance: Model, snapshot: Dict[str, Any], update_fields: Optional[Iterable[str]]
+    ) -> str:
+        if not self.is_sharded():
+            return self.Meta.name
+
+        return self.get_collection_name(self.get_shard(self._get_saved_tenant(instance, snapshot, update_fields)))
+
+    def _moved_shards(
+        self, instance: Model, snapshot: Dict[str, Any], update_fields: Optional[Iterable[str]] = None
+    ) -> bool:
+        if not self.is_sharded():
+            return False
+
+        previous_tenant = snapshot.get(self._get_shard_field().attname, DEFERRED)
+
+        if previous_tenant is DEFERRED:
+            return False
+
+        return self.get_shard(previous_tenant) != self.get_shard(
+            self._get_saved_tenant(instance, snapshot, update_fields)
+        )
+
+    def delete_document(self, pk: Any, collection_name: Optional[str] = None) -> None:
+        """
+        Deletes the document with the primary key `pk` from `collection_name`
+        - which sharded collections need to know which shard to delete from.
+        """
+
+        document_id = str(pk)
+        collection_name = collection_name or self.get_collection_name()
+
+        try:
+            self._write(
+                collection_name,
+                "delete",
+                [{"id": document_id}],
+                client.collections[collection_name].documents[document_id].delete,
+            )
+        except ObjectNotFound:
+            pass
+
+    def _import_batch(
+        self, collection_name: str, documents: List[Document], action: str, encoder: BaseEncoder, buffer: bytearray
+    ) -> List[Dict[str, Any]]:
+        encoder.encode_jsonl(documents, buffer)
+
+        # Drop the trailing newline, the rest goes out as-is.
+        body = bytes(memoryview(buffer)[:-1])
+        import_ = client.collections[collection_name].documents.import_
+
+        if getattr(settings, "DJANGO_TYPESENSE_GZIP_IMPORTS", False):
+            # JSONL compresses well even at the fastest level.
+            body = gzip.compress(body, compresslevel=1)
+            import_ = import_client.collections[collection_name].documents.import_
+        response = self._write(collection_name, action, documents, import_, body, {"action": action})
+
+        if response is None:
+            # Spilled, will be imported on replay.
+            return [
+                {"success": False, "spilled": True, "id": document["id"], "error": "Spilled for a later replay."}
+                for document in documents
+            ]
+
+        if isinstance(response, str):
+            response = response.encode()
+
+        return [result for result in encoder.decode_jsonl(response) if not result.get("success")]
+
+    @cache
+    def _get_geo_fields(self) -> Dict[str, GeoPointField]:
+        """
+        The geo fields that can be read in batch - the ones whose sources are
+        all concrete columns of the model. The rest (properties, callables,
+        related fields) are serialized per instance.
+        """
+
+        tracked = self._get_tracked_fields()
+
+        return {
+            name: field
+            for name, field in self._get_fields_dict().items()
+            if isinstance(field, GeoPointField)
+            and tracked[name] is not None
+            and not any("." in source for source in field.get_sources(name))
+        }
+
+    @cache
+    def _get_deferrable_columns(self) -> Tuple[str, ...]:
+        """
+        The columns only the batched geo fields read, which don't need to be
+        loaded with the instances. Columns that another field, the shard key
+        or `Meta.filter` reads are loaded as usual.
+        """
+
+        geo_fields = self._get_geo_fields()
+        tracked = self._get_tracked_fields()
+        used: Set[str] = set()
+
+        for name, model_fields in tracked.items():
+            if name in geo_fields:
+                continue
+            if model_fields is None:
+                # Can't tell what a callable or property reads.
+                return ()
+
+            used.update(model_field.attname for model_field in model_fields)
+
+        if self.is_sharded():
+            used.add(self._get_shard_field().attname)
+
+        if getattr(self.Meta, "filter", None) is not None:
+            filter_fields = self._get_filter_fields()
+
+            if filter_fields is None:
+                return ()
+
+            used.update(model_field.attname for model_field in filter_fields)
+
+        columns = {model_field.attname for name in geo_fields for model_field in tracked[name] or ()}
+        return tuple(sorted(columns - used))
+
+    def _geo_values(self, pks: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Reads the geopoints of a batch with a single `values_list` query and
+        converts them with `GeoPointField.from_values` - one vectorized pass
+        per field instead of a `from_value` call (and GEOS Point) per row.
+        Maps every geo field name to the `[lat, lng]` pairs by document id.
+        """
+
+        fields = self._get_geo_fields()
+        lookups = {
+            name: [source.replace(".", LOOKUP_SEP) for source in field.get_sources(name)]
+            for name, field in fields.items()
+        }
+        columns = [lookup for name in fields for lookup in lookups[name]]
+
+        rows = list(self.Meta.model._default_manager.filter(pk__in=pks).values_list("pk", *columns))
+        values: Dict[str, Dict[str, Any]] = {}
+        offset = 1
+
+        for name, field in fields.items():
+            width = len(lookups[name])
+            # Rows with a missing coordinate are left out of the document.
+            present = [(row[0], row[offset : offset + width]) for row in rows]
+            present = [(pk, coordinates) for pk, coordinates in present if None not in coordinates]
+            pairs = field.from_values([coordinates for _, coordinates in present])
+            values[name] = {str(pk): pair for (pk, _), pair in zip(present, pairs)}
+            offset += width
+
+        return values
+
+    def import_documents(
+        self,
+        instances: Optional[Iterable[Model]] = None,
+        action: str = "upsert",
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Bulk imports `instances` (or the whole queryset from `get_queryset`)
+        in batches of `batch_size` documents. `Meta.filter` is applied to a
+        queryset passed as `instances`, any other iterable is imported as-is. Every batch is encoded into the
+        same reusable buffer and sent as a single JSONL body - one per shard
+        for sharded collections.
+
+        When importing a queryset, geo fields are read in batch from
+        `values_list` rows (see `_geo_values`) instead of per instance.
+
+        Returns the per-document results Typesense reported as failed. The
+        documents of batches kept in the spill log during an outage are
+        returned too, flagged with `"spilled": True`.
+        """
+
+        if batch_size is None:
+            batch_size = getattr(settings, "DJANGO_TYPESENSE_IMPORT_BATCH_SIZE", 1000)
+
+        if instances is None:
+            instances = self.get_queryset()
+        elif isinstance(instances, QuerySet) and getattr(self.Meta, "filter", None) is not None:
+            instances = instances.filter(self.Meta.filter)
+
+        geo_fields = self._get_geo_fields() if isinstance(instances, QuerySet) else {}
+
+        if isinstance(instances, QuerySet):
+            # The geo columns are read separately, no need to load them twice.
+            instances = instances.defer(*self._get_deferrable_columns()).iterator(chunk_size=batch_size)
+
+        encoder = get_encoder()
+        buffer = bytearray()
+        failures: List[Dict[str, Any]] = []
+
+        iterator = iter(instances)
+
+        sharded = self.is_sharded()
+
+        while batch := list(itertools.islice(iterator, batch_size)):
+            batches: Dict[Optional[str], List[Document]] = {}
+            geo_values = self._geo_values([instance.pk for instance in batch]) if geo_fields else {}
+
+            for instance in batch:
+                shard = self.get_shard(self.get_tenant(instance)) if sharded else None
+                document = self.to_document(instance, exclude=geo_fields)
+
+                for name, pairs in geo_values.items():
+                    if geo_fields[name].index_empty_values:
+                        document[f"is_{name}_null"] = document["id"] not in pairs
+                    if document["id"] in pairs:
+                        document[name] = pairs[document["id"]]
+
+                batches.setdefault(shard, []).append(document)
+
+            for shard, documents in batches.items():
+                collection_name = self.get_collection_name(shard)
+
+                try:
+                    failures.extend(self._import_batch(collection_name, documents, action, encoder, buffer))
+                except ObjectNotFound:
+                    if not sharded:
+                        raise
+
+                    self.create_collection(shard)
+                    failures.extend(self._import_batch(collection_name, documents, action, encoder, buffer))
+
+        return failures
+
+    def index(
+        self,
+        shard: Optional[str] = None,
+        tenants: Optional[Iterable[Any]] = None,
+        recreate: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Creates (or with `recreate`, drops & creates) the collection - or one
+        shard of it - and imports its rows. For sharded collections only the
+        rows of `tenants` are imported.
+        """
+
+        self.create_collection(shard, recreate=recreate)
+
+        queryset = self.get_queryset()
+
+        if self.is_sharded():
+            assert tenants is not None, "Please pass the tenants of the shard to index."
+            queryset = queryset.filter(**{f"{self._get_shard_field().attname}__in": list(tenants)})
+
+        return self.import_documents(queryset, batch_size=batch_size)
+
     class Meta:
         """
         The `name` & `model` fields aren't "Optional". They're
@@ -114,3 +843,17 @@ class Collection(abc.ABC):
         # name of an numerical field to use for sorting results.
         # Typesense only supports sorting by a single field.
         order_by: Optional[str] = None
+
+        # only index the rows matching this Q object (applied in the database).
+        filter: Optional[Q] = None
+
+        # model field holding the tenant to shard by. Documents go to one
+        # `<name>__<shard>` collection per shard instead of `<name>`.
+        shard_by: Optional[str] = None
+
+        # number of shards to hash the tenants into. Without it,
+        # every tenant gets a shard of its own.
+        shards: Optional[int] = None
+
+        # explicit tenant -> shard placement, takes precedence over the above.
+        shard_placement: Optional[Dict[Any, Any]] = None
@@ -0,0 +1,182 @@
+import re
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Set, Dict, List, Tuple, Iterable, Optional, NamedTuple
+
+from django.core.exceptions import ImproperlyConfigured
+
+from django_typesense.client import client
+from django_typesense.registry import get_collections
+from django_typesense.models import TypesenseSynonym, TypesenseOverride
+
+
+Schema = Dict[str, Any]
+
+# The keys we manage per kind - anything else Typesense sends back
+# (defaults like `locale` or `stop_processing`) is ignored when diffing.
+SYNONYM_KEYS = ("synonyms", "root")
+OVERRIDE_KEYS = ("rule", "includes", "excludes", "filter_by")
+
+# Typesense v30 replaced the per-collection synonyms & overrides APIs
+# with synonym sets & curation sets.
+SETS_VERSION = 30
+
+
+class Diff(NamedTuple):
+    upserts: Dict[str, Schema]
+    deletes: List[str]
+
+
+def fingerprint(schema: Schema, keys: Iterable[str]) -> str:
+    """
+    Stable hash of the managed keys of a synonym / override schema. Empty
+    values hash the same as missing ones since Typesense fills in defaults.
+    """
+
+    projected = {key: schema.get(key) or None for key in keys}
+    return hashlib.sha1(json.dumps(projected, sort_keys=True).encode()).hexdigest()
+
+
+def diff(desired: Dict[str, Schema], live: Iterable[Schema], keys: Iterable[str]) -> Diff:
+    keys = tuple(keys)
+    live_hashes = {item["id"]: fingerprint(item, keys) for item in live}
+
+    upserts = {
+        item_id: schema
+        for item_id, schema in desired.items()
+        if live_hashes.get(item_id) != fingerprint(schema, keys)
+    }
+    deletes = [item_id for item_id in live_hashes if item_id not in desired]
+
+    return Diff(upserts, deletes)
+
+
+def _apply(endpoint: Any, changes: Diff, workers: int) -> None:
+    def upsert(item: Tuple[str, Schema]) -> None:
+        endpoint.upsert(*item)
+
+    def delete(item_id: str) -> None:
+        endpoint[item_id].delete()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() to surface the first exception, if any
+        list(executor.map(upsert, changes.upserts.items()))
+        list(executor.map(delete, changes.deletes))
+
+
+def check_server_version() -> None:
+    """
+    Raises ImproperlyConfigured if the Typesense server no longer has the
+    per-collection synonyms & overrides APIs the sync relies on.
+    """
+
+    version = client.debug.retrieve().get("version", "")
+    match = re.match(r"v?(\d+)", version)
+
+    if match is not None and int(match.group(1)) >= SETS_VERSION:
+        raise ImproperlyConfigured(
+            f"Typesense {version} replaced per-collection synonyms & overrides with synonym sets & "
+            f"curation sets, which django-typesense can't sync yet. Use a server older than v{SETS_VERSION}."
+        )
+
+
+def sync_synonyms(collection_name: str, workers: int = 8, source: Optional[str] = None) -> Diff:
+    """
+    Makes the synonyms of a Typesense collection match the TypesenseSynonym
+    rows for it (or for `source`, e.g. the logical name of a shard). The live
+    synonyms are fetched in a single request and only the ones that differ
+    are upserted or deleted, `workers` at a time.
+
+    Uses the per-collection synonyms API (overrides API for `sync_overrides`)
+    which Typesense removed in v30, so this needs a server older than that -
+    see `check_server_version`.
+    """
+
+    desired = {
+        synonym.synonym_id: synonym.to_typesense_schema()
+        for synonym in TypesenseSynonym.objects.filter(collection=source or collection_name)
+    }
+
+    endpoint = client.collections[collection_name].synonyms
+    changes = diff(desired, endpoint.retrieve()["synonyms"], SYNONYM_KEYS)
+    _apply(endpoint, changes, workers)
+
+    return changes
+
+
+def sync_overrides(collection_name: str, workers: int = 8, source: Optional[str] = None) -> Diff:
+    """
+    Same as `sync_synonyms`, for the TypesenseOverride rows of a collection.
+    """
+
+    desired = {
+        override.override_id: override.to_typesense_schema()
+        for override in TypesenseOverride.objects.filter(collection=source or collection_name)
+    }
+
+    endpoint = client.collections[collection_name].overrides
+    changes = diff(desired, endpoint.retrieve()["overrides"], OVERRIDE_KEYS)
+    _apply(endpoint, changes, workers)
+
+    return changes
+
+
+def push_curations(collection_name: str, source: str) -> None:
+    """
+    Syncs the synonyms & overrides stored under `source` to a collection
+    that was just created. Does nothing (and sends no request) without any.
+    """
+
+    if TypesenseSynonym.objects.filter(collection=source).exists():
+        sync_synonyms(collection_name, source=source)
+
+    if TypesenseOverride.objects.filter(collection=source).exists():
+        sync_overrides(collection_name, source=source)
+
+
+def get_curated_collections(collection_name: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Returns `(collection, source)` pairs to sync - `source` being the name the
+    rows are stored under. Rows stored under the name of a sharded Collection
+    apply to every one of its shards that exists - the others get them from
+    `Collection.create_collection` once they're created.
+    """
+
+    sharded = {collection.Meta.name: collection for collection in get_collections() if collection.is_sharded()}
+
+    if collection_name is not None:
+        names = {collection_name}
+    else:
+        # Registered collections are included so that their live synonyms &
+        # overrides get deleted even after all their rows are gone.
+        names = {collection.Meta.name for collection in get_collections()}
+        names.update(TypesenseSynonym.objects.values_list("collection", flat=True))
+        names.update(TypesenseOverride.objects.values_list("collection", flat=True))
+
+    pairs = []
+    existing: Optional[Set[str]] = None
+
+    for name in sorted(names):
+        if name in sharded:
+            if existing is None:
+                existing = {collection["name"] for collection in client.collections.retrieve()}
+
+            collection = sharded[name]
+            shards = [collection.get_collection_name(shard) for shard in collection.get_shards()]
+            pairs.extend((shard, name) for shard in shards if shard in existing)
+        else:
+            pairs.append((name, name))
+
+    return pairs
+
+
+__all__ = [
+    "diff",
+    "fingerprint",
+    "check_server_version",
+    "sync_synonyms",
+    "sync_overrides",
+    "push_curations",
+    "get_curated_collections",
+]
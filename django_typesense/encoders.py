@@ -0,0 +1,109 @@
+import abc
+import json
+from typing import Any, Dict, List, Iterable, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+Document = Dict[str, Any]
+
+
+def _default(value: Any) -> Any:
+    """
+    Fallback for values the encoders can't serialize natively - vectors as
+    NumPy arrays (without orjson) or memoryviews (without NumPy).
+    """
+
+    if hasattr(value, "tolist"):
+        return value.tolist()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class BaseEncoder(abc.ABC):
+    """
+    Turns documents into the JSONL body Typesense expects for
+    bulk imports. Subclasses only need to implement `dumps` &
+    `loads` - the JSONL framing is handled here.
+    """
+
+    @abc.abstractmethod
+    def dumps(self, document: Document) -> bytes:
+        pass
+
+    @abc.abstractmethod
+    def loads(self, data: bytes) -> Any:
+        pass
+
+    def encode_jsonl(self, documents: Iterable[Document], buffer: Optional[bytearray] = None) -> bytearray:
+        """
+        Writes every document followed by a newline into `buffer`. The buffer
+        is cleared first, so the same one can be handed in for every batch of
+        an import and its allocation gets reused instead of building a list
+        of strings and joining them for each batch.
+        """
+
+        if buffer is None:
+            buffer = bytearray()
+        else:
+            buffer.clear()
+
+        dumps = self.dumps
+
+        for document in documents:
+            buffer += dumps(document)
+            buffer += b"\n"
+
+        return buffer
+
+    def decode_jsonl(self, data: bytes) -> List[Any]:
+        return [self.loads(line) for line in data.splitlines() if line]
+
+
+class JSONEncoder(BaseEncoder):
+    def dumps(self, document: Document) -> bytes:
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class ORJSONEncoder(BaseEncoder):
+    """
+    Requires the `orjson` package. It serializes straight to bytes which
+    saves us the str -> bytes round trip the stdlib encoder has to do, and
+    serializes NumPy arrays natively so vectors never become Python lists.
+    """
+
+    def __init__(self):
+        assert orjson is not None, "Please install orjson to use ORJSONEncoder."
+
+    def dumps(self, document: Document) -> bytes:
+        return orjson.dumps(document, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+def get_encoder() -> BaseEncoder:
+    """
+    Returns the encoder set in `DJANGO_TYPESENSE_DOCUMENT_ENCODER` (a dotted
+    path to a BaseEncoder subclass). Falls back to ORJSONEncoder if orjson
+    is installed and to the stdlib based JSONEncoder otherwise.
+    """
+
+    encoder_path: Optional[str] = getattr(settings, "DJANGO_TYPESENSE_DOCUMENT_ENCODER", None)
+
+    if encoder_path is not None:
+        return import_string(encoder_path)()
+
+    return ORJSONEncoder() if orjson is not None else JSONEncoder()
+
+
+__all__ = ["BaseEncoder", "JSONEncoder", "ORJSONEncoder", "get_encoder"]
@@ -1,4 +1,5 @@
 from django_typesense.fields.base import BaseField, TypesenseFieldType
 from django_typesense.fields.string import StringField, EmailField, URLField
-from django_typesense.fields.misc import DateField, TimeField, DateTimeField, BooleanField
 from django_typesense.fields.number import IntegerField, LongField, FloatField, PhoneNumberField
+from django_typesense.fields.misc import DateField, TimeField, DateTimeField, BooleanField, GeoPointField
+from django_typesense.fields.array import VectorField
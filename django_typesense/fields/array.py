@@ -0,0 +1,62 @@
+from typing import Any, Optional, Union
+
+from django_typesense.fields import BaseField
+from django_typesense.fields.base import SingularTypesenseFieldsType, MultipleTypesenseFieldsType
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class VectorField(BaseField):
+    """
+    Field for embeddings to use with Typesense's nearest-neighbor search.
+
+    Accepts NumPy arrays (or any sequence of floats) as well as the raw
+    `bytes`/`memoryview` a BinaryField hands back, which are read as
+    packed little-endian float32s by default. With NumPy installed the
+    buffer is wrapped without copying and (with orjson) serialized in
+    bulk - there's never a Python float object per element.
+    """
+
+    DISTANCES = ("cosine", "ip")
+
+    # struct formats used to read buffers when NumPy isn't installed
+    BUFFER_FORMATS = {"<f4": "f", "<f8": "d"}
+
+    def __init__(self, num_dim: int, *args, distance: str = "cosine", dtype: str = "<f4", **kwargs):
+        assert num_dim > 0, "Please set `num_dim` to the number of dimensions of the vectors."
+        assert distance in self.DISTANCES, f"`distance` must be one of {', '.join(self.DISTANCES)}."
+        assert numpy is not None or dtype in self.BUFFER_FORMATS, f"Please install numpy to use dtype {dtype}."
+
+        self.num_dim: int = num_dim
+        self.distance: str = distance
+        self.dtype: str = dtype
+
+        kwargs["field_type"] = "float[]"
+        super().__init__(*args, **kwargs)
+
+    def from_value(self, value: Any) -> Any:
+        is_buffer = isinstance(value, (bytes, bytearray, memoryview))
+
+        if numpy is not None:
+            vector = numpy.frombuffer(value, dtype=self.dtype) if is_buffer else numpy.asarray(value, dtype=self.dtype)
+        elif is_buffer:
+            # Without NumPy a memoryview over the buffer is the best we can
+            # do. The encoders turn it into a list when serializing.
+            vector = memoryview(value).cast("B").cast(self.BUFFER_FORMATS[self.dtype])
+        else:
+            vector = [float(element) for element in value]
+
+        if len(vector) != self.num_dim:
+            raise ValueError(f"Expected a vector with {self.num_dim} dimensions for {self.name}, got {len(vector)}.")
+
+        return vector
+
+    def to_typesense_field_objs(
+        self, name: Optional[str] = None
+    ) -> Union[SingularTypesenseFieldsType, MultipleTypesenseFieldsType]:
+        field_objs = super().to_typesense_field_objs(name)
+        field_objs[0].update({"num_dim": self.num_dim, "vec_dist": self.distance})
+        return field_objs
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import abc
+from operator import attrgetter
 from typing import Set, Any, Dict, Union, Tuple, Optional
 
 
 TypesenseFieldKey = str
-TypesenseFieldValue = Union[str, bool]
+TypesenseFieldValue = Union[str, bool, int]
 TypesenseFieldType = Dict[TypesenseFieldKey, TypesenseFieldValue]
 
 SingularTypesenseFieldsType = Tuple[TypesenseFieldType]
@@ -58,6 +59,23 @@ class BaseField(abc.ABC):
     def from_value(self, value: Any) -> Any:
         pass
 
+    def get_sources(self, name: str) -> Tuple[str, ...]:
+        """
+        The model attributes this field's value is read from.
+        """
+        return (self.source or name,)
+
+    def value_from_instance(self, instance: Any, name: str) -> Any:
+        """
+        Reads the raw value for this field off a model instance - the attribute
+        named by `source` (dotted paths like `author.name` are allowed) falling
+        back to `name`. Callables (like model methods) are called.
+        """
+
+        value = attrgetter(self.source or name)(instance)
+
+        return value() if callable(value) else value
+
     def _empty_value_boolean_field(self) -> BaseField:
         # Avoid caching this BooleanField - it may seem tempting
         # since it looks like this field will have to be imported
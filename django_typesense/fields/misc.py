@@ -1,9 +1,14 @@
 import time
-from typing import Any
+from typing import Any, List, Tuple, Iterable, Optional
 
 from django_typesense.fields import BaseField
 from django_typesense.fields.number import LongField
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 
 class BooleanField(BaseField):
     def from_value(self, value: Any) -> bool:
@@ -36,3 +41,80 @@ class DateTimeField(LongField):
         Expects value to be a datetime.datetime object.
         """
         return super().from_value(time.mktime(value.timetuple()))
+
+
+class GeoPointField(BaseField):
+    """
+    Field for a `[lat, lng]` pair. The pair is read either from a single
+    `source` - a GeoDjango Point (x is the longitude, y the latitude) or
+    a (lat, lng) sequence - or from two float columns with `lat_source`
+    & `lng_source`.
+
+    Bulk imports of a queryset read the pairs with `values_list` and
+    convert them in batch with `from_values`, instead of going through
+    the model instances.
+    """
+
+    def __init__(self, *args, lat_source: Optional[str] = None, lng_source: Optional[str] = None, **kwargs):
+        assert (lat_source is None) == (lng_source is None), "Please set both `lat_source` & `lng_source`."
+        assert lat_source is None or kwargs.get("source") is None, "Please set either `source` or `lat_source`."
+
+        self.lat_source: Optional[str] = lat_source
+        self.lng_source: Optional[str] = lng_source
+
+        kwargs["field_type"] = "geopoint"
+        super().__init__(*args, **kwargs)
+
+    def get_sources(self, name: str) -> Tuple[str, ...]:
+        if self.lat_source is not None and self.lng_source is not None:
+            return self.lat_source, self.lng_source
+
+        return super().get_sources(name)
+
+    @property
+    def sources(self) -> Tuple[str, ...]:
+        assert self.source or self.name, f"Please set `source` or `name` for {self.__class__.__name__} field."
+        return self.get_sources(self.name)  # type: ignore[arg-type]
+
+    def value_from_instance(self, instance: Any, name: str) -> Any:
+        if self.lat_source is None:
+            return super().value_from_instance(instance, name)
+
+        lat, lng = getattr(instance, self.lat_source), getattr(instance, self.lng_source)
+        return None if lat is None or lng is None else (lat, lng)
+
+    @staticmethod
+    def _check_range(lat: float, lng: float) -> None:
+        if not -90 <= lat <= 90 or not -180 <= lng <= 180:
+            raise ValueError(f"Invalid geopoint ({lat}, {lng}).")
+
+    def from_value(self, value: Any) -> List[float]:
+        if hasattr(value, "x") and hasattr(value, "y"):
+            lat, lng = float(value.y), float(value.x)
+        else:
+            lat, lng = float(value[0]), float(value[1])
+
+        self._check_range(lat, lng)
+        return [lat, lng]
+
+    def from_values(self, rows: Iterable[Any]) -> Any:
+        """
+        Converts a batch of `values_list(*self.sources)` rows - `(lat, lng)`
+        tuples or 1-tuples of Points - into `[lat, lng]` pairs, with a single
+        vectorized range check when NumPy is installed. Rows with a missing
+        coordinate must be filtered out beforehand.
+        """
+
+        rows = [row if len(row) == 2 else (row[0].y, row[0].x) for row in rows]
+
+        if numpy is None:
+            return [self.from_value(row) for row in rows]
+
+        pairs = numpy.asarray(rows, dtype=float).reshape(-1, 2)
+        invalid = (numpy.abs(pairs[:, 0]) > 90) | (numpy.abs(pairs[:, 1]) > 180) | numpy.isnan(pairs).any(axis=1)
+
+        if invalid.any():
+            lat, lng = pairs[invalid.argmax()]
+            raise ValueError(f"Invalid geopoint ({lat}, {lng}).")
+
+        return pairs
@@ -1,8 +1,85 @@
-from django.core.management.base import BaseCommand
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+from django.core.management.base import BaseCommand, CommandError
+
+from django_typesense.registry import get_collections
 
 
 class Command(BaseCommand):
-    help = "Create Typesense indices"
+    help = "Create Typesense indices and import the documents into them"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--collection", help="Only index this collection")
+        parser.add_argument(
+            "--tenant", action="append", default=[], help="Only index the shards of these tenants (repeatable)"
+        )
+        parser.add_argument("--recreate", action="store_true", help="Drop & recreate the collections first")
+        parser.add_argument("--workers", type=int, default=4, help="Number of shards indexed in parallel (default: 4)")
+        parser.add_argument("--batch-size", type=int, help="Number of documents per import request")
+
+    def index(self, collection, shard, tenants, options):
+        failures = collection.index(
+            shard, tenants=tenants, recreate=options["recreate"], batch_size=options["batch_size"]
+        )
+        spilled = [failure for failure in failures if failure.get("spilled")]
+
+        for failure in failures:
+            if not failure.get("spilled"):
+                self.stderr.write(f"Failed to import document: {failure}")
+
+        self.stdout.write(
+            f"{collection.get_collection_name(shard)}: {len(failures) - len(spilled)} failed, {len(spilled)} spilled"
+        )
+
+        return len(spilled)
+
+    def index_shard(self, collection, shard, tenants, options):
+        try:
+            return self.index(collection, shard, tenants, options)
+        finally:
+            # Every worker thread opens database connections of its own.
+            connections.close_all()
 
     def handle(self, **options):
-        pass
+        collections = [
+            collection
+            for collection in get_collections()
+            if options["collection"] in (None, collection.Meta.name)
+        ]
+
+        if not collections:
+            raise CommandError(f"No registered Collection is named {options['collection']}.")
+
+        spilled = 0
+
+        for collection in collections:
+            if not collection.is_sharded():
+                if options["tenant"]:
+                    raise CommandError(f"{collection.Meta.name} is not sharded by tenant.")
+
+                spilled += self.index(collection, None, None, options)
+                continue
+
+            tenants_by_shard = collection.get_tenants_by_shard()
+
+            if options["tenant"]:
+                # A shard may hold several tenants - all of them get indexed.
+                to_python = collection._get_shard_field().to_python
+                shards = {collection.get_shard(to_python(tenant)) for tenant in options["tenant"]}
+                tenants_by_shard = {shard: tenants_by_shard.get(shard, []) for shard in shards}
+
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                futures = [
+                    executor.submit(self.index_shard, collection, shard, tenants, options)
+                    for shard, tenants in tenants_by_shard.items()
+                ]
+
+                for future in futures:
+                    spilled += future.result()
+
+        if spilled:
+            # Typesense went away mid-import - the index is incomplete until the spill log is replayed.
+            raise CommandError(f"{spilled} documents were spilled, they are imported when the spill log is replayed.")
+
+        self.stdout.write(self.style.SUCCESS("Indexed the Typesense collections."))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_typesense.spill import get_spill_log
+
+
+class Command(BaseCommand):
+    help = "Replay the Typesense writes spilled to disk during an outage"
+
+    def handle(self, **options):
+        spill_log = get_spill_log()
+
+        if spill_log is None:
+            raise CommandError("DJANGO_TYPESENSE_SPILL_DIR is not set.")
+
+        failures = spill_log.replay()
+
+        for failure in failures:
+            self.stderr.write(f"Failed to import document: {failure}")
+
+        self.stdout.write(self.style.SUCCESS("Replayed the Typesense spill log."))
@@ -0,0 +1,35 @@
+from typesense.exceptions import ObjectNotFound
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from django_typesense.curation import sync_synonyms, sync_overrides, check_server_version, get_curated_collections
+
+
+class Command(BaseCommand):
+    help = "Sync the Typesense synonyms & overrides with the ones stored in the database (Typesense < v30)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--collection", help="Only sync this collection")
+        parser.add_argument("--workers", type=int, default=8, help="Number of parallel requests (default: 8)")
+
+    def handle(self, **options):
+        try:
+            check_server_version()
+        except ImproperlyConfigured as exc:
+            raise CommandError(str(exc))
+
+        for collection_name, source in get_curated_collections(options["collection"]):
+            try:
+                synonyms = sync_synonyms(collection_name, workers=options["workers"], source=source)
+                overrides = sync_overrides(collection_name, workers=options["workers"], source=source)
+            except ObjectNotFound:
+                # Not created yet - `create_collection` pushes the curations when it is.
+                self.stdout.write(self.style.WARNING(f"{collection_name}: skipped, the collection doesn't exist"))
+                continue
+
+            self.stdout.write(
+                f"{collection_name}: "
+                f"{len(synonyms.upserts)} synonyms upserted, {len(synonyms.deletes)} deleted, "
+                f"{len(overrides.upserts)} overrides upserted, {len(overrides.deletes)} deleted"
+            )
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_typesense', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TypesenseOverride',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('collection', models.CharField(db_index=True, help_text='Name of the Typesense collection', max_length=255)),
+                ('override_id', models.SlugField(help_text='ID of the override in Typesense', max_length=255)),
+                ('query', models.CharField(help_text='The query this override applies to', max_length=255)),
+                ('match', models.CharField(choices=[('exact', 'Exact'), ('contains', 'Contains')], default='exact', max_length=16)),
+                ('includes', models.JSONField(blank=True, default=list, help_text='Documents to pin, as a list of {"id": ..., "position": ...} objects')),
+                ('excludes', models.JSONField(blank=True, default=list, help_text='Documents to hide, as a list of {"id": ...} objects')),
+                ('filter_by', models.CharField(blank=True, default='', help_text='Filter to apply to the query', max_length=255)),
+            ],
+            options={
+                'verbose_name': 'Typesense override',
+                'verbose_name_plural': 'Typesense overrides',
+                'unique_together': {('collection', 'override_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TypesenseSynonym',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('collection', models.CharField(db_index=True, help_text='Name of the Typesense collection', max_length=255)),
+                ('synonym_id', models.SlugField(help_text='ID of the synonym in Typesense', max_length=255)),
+                ('root', models.CharField(blank=True, default='', help_text='Makes this a one-way synonym - only searches for the root also match the synonyms', max_length=255)),
+                ('synonyms', models.TextField(help_text='Comma-separated list of words that should be considered equivalent')),
+            ],
+            options={
+                'verbose_name': 'Typesense synonym',
+                'verbose_name_plural': 'Typesense synonyms',
+                'unique_together': {('collection', 'synonym_id')},
+            },
+        ),
+    ]
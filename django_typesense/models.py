@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -134,3 +136,87 @@ class TypesenseAPIKey(models.Model):
 
     def __str__(self) -> str:
         return self.value
+
+
+class TypesenseSynonym(models.Model):
+    """
+    Stores a synonym of a Typesense collection. Synonyms are pushed to
+    Typesense in bulk with the `sync_curations` management command.
+    """
+
+    collection = models.CharField(max_length=255, db_index=True, help_text=_("Name of the Typesense collection"))
+    synonym_id = models.SlugField(max_length=255, help_text=_("ID of the synonym in Typesense"))
+
+    root = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text=_("Makes this a one-way synonym - only searches for the root also match the synonyms"),
+    )
+    synonyms = models.TextField(help_text=_("Comma-separated list of words that should be considered equivalent"))
+
+    class Meta:
+        verbose_name = _("Typesense synonym")
+        verbose_name_plural = _("Typesense synonyms")
+        unique_together = ("collection", "synonym_id")
+
+    def to_typesense_schema(self) -> Dict[str, Any]:
+        schema: Dict[str, Any] = {"synonyms": [word.strip() for word in self.synonyms.split(",") if word.strip()]}
+
+        if self.root:
+            schema["root"] = self.root
+
+        return schema
+
+    def __str__(self) -> str:
+        return self.synonym_id
+
+
+class TypesenseOverride(models.Model):
+    """
+    Stores an override (curation) of a Typesense collection - documents to pin
+    to or hide from the results of a query. Pushed to Typesense in bulk with
+    the `sync_curations` management command.
+    """
+
+    class Match(models.TextChoices):
+        EXACT = "exact", _("Exact")
+        CONTAINS = "contains", _("Contains")
+
+    collection = models.CharField(max_length=255, db_index=True, help_text=_("Name of the Typesense collection"))
+    override_id = models.SlugField(max_length=255, help_text=_("ID of the override in Typesense"))
+
+    query = models.CharField(max_length=255, help_text=_("The query this override applies to"))
+    match = models.CharField(max_length=16, choices=Match.choices, default=Match.EXACT)
+
+    includes = models.JSONField(
+        blank=True,
+        default=list,
+        help_text=_('Documents to pin, as a list of {"id": ..., "position": ...} objects'),
+    )
+    excludes = models.JSONField(
+        blank=True,
+        default=list,
+        help_text=_('Documents to hide, as a list of {"id": ...} objects'),
+    )
+    filter_by = models.CharField(max_length=255, blank=True, default="", help_text=_("Filter to apply to the query"))
+
+    class Meta:
+        verbose_name = _("Typesense override")
+        verbose_name_plural = _("Typesense overrides")
+        unique_together = ("collection", "override_id")
+
+    def to_typesense_schema(self) -> Dict[str, Any]:
+        schema: Dict[str, Any] = {"rule": {"query": self.query, "match": self.match}}
+
+        if self.includes:
+            schema["includes"] = self.includes
+        if self.excludes:
+            schema["excludes"] = self.excludes
+        if self.filter_by:
+            schema["filter_by"] = self.filter_by
+
+        return schema
+
+    def __str__(self) -> str:
+        return self.override_id
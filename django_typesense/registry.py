@@ -0,0 +1,38 @@
+from typing import Dict, List, Type, Optional
+
+from django.db.models import Model
+
+from django_typesense.collection import Collection
+
+
+_registry: Dict[Type[Model], Collection] = {}
+
+
+def register(collection_class: Type[Collection]) -> Type[Collection]:
+    """
+    Class decorator that registers a Collection for its `Meta.model`, so the
+    admin, signals & management commands can find it. Collections are usually
+    declared in an `index.py` module of an app, which is imported on startup.
+
+    >>> @register
+    ... class PostCollection(Collection):
+    ...     ...
+    """
+
+    model = collection_class.Meta.model
+
+    assert model is not None, f"Please set Meta.model for {collection_class.__name__} Collection."
+
+    _registry[model] = collection_class()
+    return collection_class
+
+
+def get_collection(model: Type[Model]) -> Optional[Collection]:
+    return _registry.get(model)
+
+
+def get_collections() -> List[Collection]:
+    return list(_registry.values())
+
+
+__all__ = ["register", "get_collection", "get_collections"]
@@ -0,0 +1,269 @@
+import time
+import random
+import threading
+from collections import deque
+from urllib.parse import urlencode
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Set, Dict, List, Deque, Optional
+
+from typesense import Client
+from typesense.exceptions import (
+    ObjectNotFound,
+    RequestMalformed,
+    RequestForbidden,
+    RequestUnauthorized,
+    ObjectUnprocessable,
+)
+from typesense.request_handler import RequestHandler
+
+from django.conf import settings
+
+from django_typesense.client import get_client_config
+
+
+# Errors caused by the request itself - another node would say the same
+# thing, so there's no point in failing over (or blaming the node).
+REQUEST_ERRORS = (ObjectNotFound, RequestMalformed, RequestForbidden, RequestUnauthorized, ObjectUnprocessable)
+
+# Typesense rejects GET searches whose query string is longer than this.
+MAX_GET_PARAMS_LENGTH = 4000
+
+
+class NodeStats:
+    """
+    Latency & health bookkeeping for a single Typesense node. Latency is
+    tracked as an exponentially weighted moving average along with a small
+    window of raw samples to estimate the p95 used as the hedging delay.
+    """
+
+    def __init__(self, node: Dict[str, Any], alpha: float = 0.3, window: int = 100):
+        self.node = node
+        self.alpha = alpha
+        self.ewma: Optional[float] = None
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.unhealthy_until: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.ewma = seconds if self.ewma is None else self.alpha * seconds + (1 - self.alpha) * self.ewma
+        self.unhealthy_until = 0.0
+
+    def mark_unhealthy(self, cooldown: float) -> None:
+        self.unhealthy_until = time.monotonic() + cooldown
+
+    def p95(self) -> Optional[float]:
+        if not self.samples:
+            return None
+
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+class ReadRouter:
+    """
+    Routes searches to the node with the lowest latency instead of the
+    round-robin rotation of the stock client. Every node gets its own
+    single-node client (without retries) so that we decide where a
+    retry goes. Nodes that fail are skipped for
+    `TYPESENSE_HEALTHCHECK_INTERVAL_SECONDS`.
+
+    The primary node is picked with the power of two choices - the faster of
+    two random healthy nodes - so the load is spread over the cluster instead
+    of piling onto the single fastest node. A `TYPESENSE_READ_PROBE_RATE`
+    fraction of the searches (default 5%) goes to a random healthy node
+    instead, so a node that had a slow spell gets measured again.
+
+    With `TYPESENSE_HEDGED_READS = True` a search that hasn't answered
+    within the primary node's p95 latency is also sent to the next
+    fastest node, and whichever reply arrives first wins. Hedged searches
+    run on a pool of `TYPESENSE_HEDGE_WORKERS` threads which is never
+    queued on - when no worker is free the search runs on the calling
+    thread without a hedge, and a hedge is dropped.
+
+    Searches with a `vector_query`, or whose parameters don't fit in the
+    query string of a GET request, are sent as a (POST) multi_search.
+    """
+
+    def __init__(self, nodes: List[Dict[str, Any]]):
+        self.stats: List[NodeStats] = [NodeStats(node) for node in nodes]
+        self.clients: List[Client] = [Client(get_client_config(nodes=[node], num_retries=0)) for node in nodes]
+
+        self.hedge: bool = getattr(settings, "TYPESENSE_HEDGED_READS", False)
+        self.hedge_delay: float = getattr(settings, "TYPESENSE_HEDGE_DELAY_SECONDS", 0.05)
+        self.cooldown: float = getattr(settings, "TYPESENSE_HEALTHCHECK_INTERVAL_SECONDS", 60)
+        self.probe_rate: float = getattr(settings, "TYPESENSE_READ_PROBE_RATE", 0.05)
+        self.hedge_workers: int = getattr(settings, "TYPESENSE_HEDGE_WORKERS", 2 * len(nodes))
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._free_workers = threading.BoundedSemaphore(self.hedge_workers)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.hedge_workers, thread_name_prefix="typesense-read"
+                )
+            return self._executor
+
+    def ranked(self) -> List[int]:
+        """
+        Indices of the nodes ordered from the most to the least preferred.
+        Nodes without any samples yet come first so they get measured, then
+        the primary picked by `_pick` followed by the rest from the fastest
+        to the slowest. Unhealthy nodes come last (but are still tried as a
+        last resort).
+        """
+
+        def key(index: int):
+            stats = self.stats[index]
+            return not stats.healthy, -1.0 if stats.ewma is None else stats.ewma
+
+        candidates = sorted(range(len(self.stats)), key=key)
+        primary = self._pick(candidates)
+
+        if primary is not None:
+            candidates.remove(primary)
+            candidates.insert(0, primary)
+
+        return candidates
+
+    def _pick(self, candidates: List[int]) -> Optional[int]:
+        healthy = [index for index in candidates if self.stats[index].healthy]
+
+        if len(healthy) < 2 or self.stats[healthy[0]].ewma is None:
+            return None
+
+        if random.random() < self.probe_rate:
+            return random.choice(healthy)
+
+        # Power of two choices - `healthy` is sorted, so the first is faster.
+        return healthy[min(random.sample(range(len(healthy)), 2))]
+
+    def _search(self, index: int, collection_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        stats = self.stats[index]
+        start = time.perf_counter()
+
+        try:
+            if self._needs_post(params):
+                result = self._post_search(self.clients[index], collection_name, params)
+            else:
+                result = self.clients[index].collections[collection_name].documents.search(params)
+        except REQUEST_ERRORS:
+            raise
+        except Exception:
+            with self._lock:
+                stats.mark_unhealthy(self.cooldown)
+            raise
+
+        with self._lock:
+            stats.observe(time.perf_counter() - start)
+
+        return result
+
+    @staticmethod
+    def _needs_post(params: Dict[str, Any]) -> bool:
+        return "vector_query" in params or len(urlencode(params)) > MAX_GET_PARAMS_LENGTH
+
+    @staticmethod
+    def _post_search(client: Client, collection_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        response = client.multi_search.perform({"searches": [{**params, "collection": collection_name}]}, {})
+        result = response["results"][0]
+
+        if "error" in result:
+            # Errors come back inside the (200) response - raise them as a
+            # GET search would, so they're treated the same way.
+            code = result.get("code", 500)
+            raise RequestHandler._get_exception(code)(code, result["error"])
+
+        return result
+
+    def _search_in_order(self, candidates: List[int], collection_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        last_error: Optional[BaseException] = None
+
+        for index in candidates:
+            try:
+                return self._search(index, collection_name, params)
+            except REQUEST_ERRORS:
+                raise
+            except Exception as exc:
+                last_error = exc
+
+        assert last_error is not None
+        raise last_error
+
+    def search(self, collection_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        candidates = self.ranked()
+
+        if not self.hedge or len(candidates) == 1:
+            return self._search_in_order(candidates, collection_name, params)
+
+        return self._hedged_search(candidates, collection_name, params)
+
+    def _submit(self, index: int, collection_name: str, params: Dict[str, Any]) -> Optional[Future]:
+        """
+        Runs the search on a free worker, or returns None if there's none.
+        """
+
+        if not self._free_workers.acquire(blocking=False):
+            return None
+
+        try:
+            future = self.executor.submit(self._search, index, collection_name, params)
+        except BaseException:
+            self._free_workers.release()
+            raise
+
+        future.add_done_callback(lambda _: self._free_workers.release())
+        return future
+
+    def _hedged_search(self, candidates: List[int], collection_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        primary = self._submit(candidates[0], collection_name, params)
+
+        if primary is None:
+            # Every worker is busy - rather than queue (and blow up the
+            # latency we hedge against) search on this thread, unhedged.
+            return self._search_in_order(candidates, collection_name, params)
+
+        pending: Set[Future] = {primary}
+        remaining = deque(candidates[1:])
+
+        delay = self.stats[candidates[0]].p95() or self.hedge_delay
+        done, _ = wait(pending, timeout=delay)
+
+        if not done and remaining:
+            hedge = self._submit(remaining[0], collection_name, params)
+
+            if hedge is not None:
+                remaining.popleft()
+                pending.add(hedge)
+
+        last_error: Optional[BaseException] = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                error = future.exception()
+
+                if error is None:
+                    return future.result()
+                if isinstance(error, REQUEST_ERRORS):
+                    raise error
+
+                last_error = error
+
+        # Everything in flight failed - move on to the next nodes.
+        if remaining:
+            return self._search_in_order(list(remaining), collection_name, params)
+
+        assert last_error is not None
+        raise last_error
+
+
+__all__ = ["NodeStats", "ReadRouter"]
@@ -0,0 +1,48 @@
+from typing import Any, Optional
+
+from django_typesense.encoders import get_encoder
+
+
+def vector_query(field_name: str, vector: Any, k: int = 10, distance_threshold: Optional[float] = None) -> str:
+    """
+    Builds the `vector_query` search parameter for a nearest-neighbor search
+    on a VectorField. `vector` may be anything the VectorField accepts as a
+    value except raw bytes - run those through `VectorField.from_value` first.
+
+    >>> collection.search({"q": "*", "vector_query": vector_query("embedding", embedding, k=5)})
+
+    Long vectors easily exceed the URL length limit of a GET search, so
+    `Collection.search` sends searches with a `vector_query` as a POST
+    multi_search request.
+    """
+
+    params = f"k:{k}"
+
+    if distance_threshold is not None:
+        params += f", distance_threshold:{distance_threshold}"
+
+    values = get_encoder().dumps(vector).decode()
+
+    return f"{field_name}:({values}, {params})"
+
+
+def geo_radius_filter(field_name: str, lat: float, lng: float, radius: float, unit: str = "km") -> str:
+    """
+    Builds a `filter_by` clause matching the documents whose GeoPointField
+    lies within `radius` (in `unit`, "km" or "mi") of the given point.
+    """
+
+    assert unit in ("km", "mi"), "`unit` must be either km or mi."
+
+    return f"{field_name}:({lat}, {lng}, {radius} {unit})"
+
+
+def geo_sort(field_name: str, lat: float, lng: float, descending: bool = False) -> str:
+    """
+    Builds a `sort_by` clause ordering the documents by their distance to the given point.
+    """
+
+    return f"{field_name}({lat}, {lng}):{'desc' if descending else 'asc'}"
+
+
+__all__ = ["vector_query", "geo_radius_filter", "geo_sort"]
@@ -1,18 +1,24 @@
-from typing import Type
+import logging
+from functools import partial
+from typing import Any, Type, Callable
 
 from django.conf import settings
 from django.apps import AppConfig
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.dispatch import receiver
 from django.core.management.base import OutputWrapper
 from django.utils.translation import gettext_lazy as _
-from django.db.models.signals import pre_save, post_migrate
+from django.db.models.signals import pre_save, post_init, post_save, post_delete, post_migrate
 
 from django_typesense.client import client
 from django_typesense.models import TypesenseAPIKey
+from django_typesense.registry import get_collection
 from django_typesense.apps import DjangoTypesenseConfig
 
 
+logger = logging.getLogger(__name__)
+
+
 @receiver(post_migrate)
 def populate_actions(sender: AppConfig, stdout: OutputWrapper, verbosity: int, **kwargs):
     """
@@ -79,3 +85,70 @@ def sync_typesense_value_into_db(sender: Type[TypesenseAPIKey], instance: Typese
     )
 
     instance.value = resp["value"]
+
+
+def _auto_sync() -> bool:
+    return getattr(settings, "DJANGO_TYPESENSE_AUTO_SYNC", True)
+
+
+@receiver(post_init)
+def snapshot_indexed_values(sender, instance, **kwargs):
+    """
+    Remember the values the indexed fields are read from as they were loaded,
+    so that a later save only sends what actually changed.
+    """
+
+    collection = get_collection(sender)
+
+    if collection is not None and _auto_sync():
+        instance._typesense_snapshot = collection.snapshot(instance)
+
+
+@receiver(pre_save)
+def forget_unloaded_snapshot(sender, instance, **kwargs):
+    """
+    Only instances loaded from the database can be diffed against their
+    snapshot. A constructed (or deserialized) instance may be saved over an
+    existing row, so it's synced with a full upsert instead.
+    """
+
+    if instance._state.adding and get_collection(sender) is not None:
+        instance.__dict__.pop("_typesense_snapshot", None)
+
+
+def _run_logged(func: Callable[..., Any], *args, **kwargs) -> None:
+    # A failed index write must never fail (or undo) the save it follows.
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Syncing into Typesense failed, the index may be stale until the next write.")
+
+
+@receiver(post_save)
+def sync_instance_into_typesense(sender, instance, created: bool, update_fields=None, using=None, **kwargs):
+    """
+    Syncs the instance once the transaction it was saved in commits - nothing
+    is sent for rolled back saves, and the snapshot isn't refreshed either.
+    """
+
+    collection = get_collection(sender)
+
+    if collection is not None and _auto_sync():
+        transaction.on_commit(
+            partial(_run_logged, collection.sync, instance, created=created, update_fields=update_fields),
+            using=using,
+        )
+
+
+@receiver(post_delete)
+def delete_instance_from_typesense(sender, instance, using=None, **kwargs):
+    collection = get_collection(sender)
+
+    if collection is not None and _auto_sync():
+        # Django clears the pk after the delete, so read it now.
+        transaction.on_commit(
+            partial(
+                _run_logged, collection.delete_document, instance.pk, collection.get_collection_name_for(instance)
+            ),
+            using=using,
+        )
@@ -0,0 +1,342 @@
+import os
+import time
+import zlib
+import mmap
+import struct
+import logging
+import threading
+from pathlib import Path
+from functools import lru_cache
+from typing import Any, IO, Dict, List, Tuple, Iterable, Optional
+
+from django.conf import settings
+from django.db import connections
+
+from django_typesense.client import client
+from django_typesense.breaker import breaker
+from django_typesense.encoders import BaseEncoder, get_encoder
+from django_typesense.collection import Collection
+from django_typesense.registry import get_collections
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+Document = Dict[str, Any]
+
+# Every record is prefixed with the length & CRC32 of its body so
+# that a torn write at the end of a segment can be detected and dropped.
+HEADER = struct.Struct("<II")
+
+SEGMENT_SUFFIX = ".seg"
+
+
+class SpillLog:
+    """
+    Append-only on-disk log of the writes that couldn't reach Typesense.
+    Only the collection, action & id of a write are kept - the document is
+    rebuilt from the database on replay, so replaying can never bring back
+    an older version of it than what is saved.
+
+    Every process appends to its own segment file which it holds an exclusive
+    `flock` on until the segment is rotated, so `replay` (from any process)
+    only ever touches segments nobody is writing to anymore. Every append is
+    flushed to the OS right away, so it survives the process getting killed.
+    Appends are fsync-ed in batches - after `fsync_every` records or at most
+    `fsync_interval` seconds later from a timer, whichever comes first - and
+    on rotation.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        fsync_every: int = 100,
+        fsync_interval: float = 1.0,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        encoder: Optional[BaseEncoder] = None,
+    ):
+        assert fcntl is not None, "The spill log relies on flock and is only available on POSIX systems."
+
+        self.directory = Path(directory)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.max_segment_bytes = max_segment_bytes
+        self.encoder = encoder or get_encoder()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._file: Optional[IO[bytes]] = None
+        self._size: int = 0
+        self._unsynced: int = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def _open_segment(self) -> IO[bytes]:
+        # Create & lock the segment under a temporary name first. It only
+        # becomes visible to `replay` once we're holding the lock on it.
+        name = f"{time.time_ns():020d}-{os.getpid()}-{threading.get_ident()}"
+        tmp_path = self.directory / f"{name}.tmp"
+
+        segment = open(tmp_path, "ab")
+        fcntl.flock(segment, fcntl.LOCK_EX)
+        tmp_path.rename(self.directory / f"{name}{SEGMENT_SUFFIX}")
+
+        self._size = 0
+
+        return segment
+
+    def _sync(self) -> None:
+        assert self._file is not None
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self._unsynced = 0
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _sync_on_timer(self) -> None:
+        with self._lock:
+            # A sync (or rotation) may have raced us and replaced the timer.
+            if self._timer is not threading.current_thread():
+                return
+
+            self._timer = None
+
+            if self._file is not None and self._unsynced:
+                self._sync()
+
+    def append(self, collection_name: str, action: str, documents: Iterable[Document]) -> None:
+        dumps = self.encoder.dumps
+        timestamp = time.time_ns()
+
+        with self._lock:
+            if self._file is None:
+                self._file = self._open_segment()
+
+            for document in documents:
+                body = dumps([timestamp, collection_name, action, str(document["id"])])
+                self._file.write(HEADER.pack(len(body), zlib.crc32(body)))
+                self._file.write(body)
+
+                self._size += HEADER.size + len(body)
+                self._unsynced += 1
+
+            self._file.flush()
+
+            if self._unsynced >= self.fsync_every:
+                self._sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.fsync_interval, self._sync_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+            if self._size >= self.max_segment_bytes:
+                self._close_segment()
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            self._sync()
+            self._file.close()  # releases the flock
+            self._file = None
+
+    def rotate(self) -> None:
+        """
+        Closes the current segment (if any) making it available for replay.
+        """
+        with self._lock:
+            self._close_segment()
+
+    def segments(self) -> List[Path]:
+        return sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def _read_segment(self, segment: IO[bytes]) -> List[List[Any]]:
+        size = os.fstat(segment.fileno()).st_size
+        records: List[List[Any]] = []
+
+        if size == 0:
+            return records
+
+        with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            offset = 0
+
+            while offset + HEADER.size <= size:
+                length, checksum = HEADER.unpack_from(view, offset)
+                start, end = offset + HEADER.size, offset + HEADER.size + length
+
+                body = view[start:end]
+
+                if end > size or zlib.crc32(body) != checksum:
+                    logger.warning("Dropping torn record at offset %d of %s.", offset, segment.name)
+                    break
+
+                records.append(self.encoder.loads(body))
+                offset = end
+
+        return records
+
+    @staticmethod
+    def deduplicate(records: List[List[Any]]) -> Dict[str, List[str]]:
+        """
+        Collapses the records down to the ids of the spilled documents of
+        every collection, in the order they were first written.
+        """
+
+        spilled: Dict[str, Dict[str, None]] = {}
+
+        for _, collection_name, _, document_id in sorted(records, key=lambda record: record[0]):
+            spilled.setdefault(collection_name, {})[document_id] = None
+
+        return {collection_name: list(ids) for collection_name, ids in spilled.items()}
+
+    @staticmethod
+    def _get_collection(collection_name: str) -> Optional[Collection]:
+        for collection in get_collections():
+            prefix = f"{collection.Meta.name}__"
+
+            if collection.Meta.name == collection_name or (
+                collection.is_sharded() and collection_name.startswith(prefix)
+            ):
+                return collection
+
+        return None
+
+    def _apply(self, spilled: Dict[str, List[str]], batch_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Sends the current database state of every spilled document - upserted
+        if it's still indexed (in that collection), deleted otherwise.
+        """
+
+        failures: List[Dict[str, Any]] = []
+        buffer = bytearray()
+
+        for collection_name, ids in spilled.items():
+            collection = self._get_collection(collection_name)
+
+            if collection is None:
+                logger.error("Dropping %d spilled writes for unregistered collection %s.", len(ids), collection_name)
+                continue
+
+            endpoint = client.collections[collection_name].documents
+
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start : start + batch_size]
+                documents = [
+                    collection.to_document(instance)
+                    for instance in collection.get_queryset().filter(pk__in=batch)
+                    if collection.get_collection_name_for(instance) == collection_name
+                ]
+
+                indexed = {document["id"] for document in documents}
+                deletes = [document_id for document_id in batch if document_id not in indexed]
+
+                for offset in range(0, len(deletes), 100):
+                    endpoint.delete({"filter_by": f"id:[{','.join(deletes[offset : offset + 100])}]"})
+
+                if not documents:
+                    continue
+
+                self.encoder.encode_jsonl(documents, buffer)
+                response = endpoint.import_(bytes(memoryview(buffer)[:-1]), {"action": "upsert"})
+
+                if isinstance(response, str):
+                    response = response.encode()
+
+                failures.extend(result for result in self.encoder.decode_jsonl(response) if not result.get("success"))
+
+        return failures
+
+    def replay(self) -> List[Dict[str, Any]]:
+        """
+        Drains every segment that isn't being written to into Typesense using
+        bulk imports of the documents as they are in the database. Segments are only removed
+        once everything in them was sent - if Typesense is still unreachable
+        the exception propagates and the segments stay around for next time.
+
+        Returns the per-document results Typesense reported as failed.
+        """
+
+        self.rotate()
+
+        locked: List[Tuple[IO[bytes], Path]] = []
+        records: List[List[Any]] = []
+
+        try:
+            for path in self.segments():
+                segment = open(path, "rb")
+
+                try:
+                    fcntl.flock(segment, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # Still being written to by another process.
+                    segment.close()
+                    continue
+
+                locked.append((segment, path))
+                records.extend(self._read_segment(segment))
+
+            failures = self._apply(self.deduplicate(records))
+
+            for _, path in locked:
+                path.unlink()
+        finally:
+            for segment, _ in locked:
+                segment.close()
+
+        return failures
+
+
+_replay_lock = threading.Lock()
+
+
+def _replay_in_background(spill_log: SpillLog) -> None:
+    def run():
+        if not _replay_lock.acquire(blocking=False):
+            return
+        try:
+            spill_log.replay()
+        except Exception:
+            logger.exception("Replaying the Typesense spill log failed.")
+        finally:
+            _replay_lock.release()
+            # The replay read from the database on this thread.
+            connections.close_all()
+
+    threading.Thread(target=run, name="typesense-spill-replay", daemon=True).start()
+
+
+@lru_cache(maxsize=None)
+def get_spill_log() -> Optional[SpillLog]:
+    """
+    Returns the process wide SpillLog, or None if `DJANGO_TYPESENSE_SPILL_DIR`
+    isn't set - in which case failed writes raise as usual.
+    """
+
+    directory: Optional[str] = getattr(settings, "DJANGO_TYPESENSE_SPILL_DIR", None)
+
+    if directory is None:
+        return None
+
+    spill_log = SpillLog(
+        directory,
+        fsync_every=getattr(settings, "DJANGO_TYPESENSE_SPILL_FSYNC_EVERY", 100),
+        fsync_interval=getattr(settings, "DJANGO_TYPESENSE_SPILL_FSYNC_INTERVAL_SECONDS", 1.0),
+    )
+
+    # Once Typesense is reachable again hand our segment over for replay,
+    # and replay it right away unless that's left to the `replay` command.
+    breaker.on_close(spill_log.rotate)
+
+    if getattr(settings, "DJANGO_TYPESENSE_SPILL_AUTO_REPLAY", True):
+        breaker.on_close(lambda: _replay_in_background(spill_log))
+
+    return spill_log
+
+
+__all__ = ["SpillLog", "get_spill_log"]
@@ -20,14 +20,35 @@ try:
                 }
             },
             INSTALLED_APPS=[
+                "django.contrib.admin",
                 "django.contrib.auth",
                 "django.contrib.contenttypes",
+                "django.contrib.messages",
+                "django.contrib.sessions",
                 "django.contrib.sites",
                 "django_typesense",
                 "tests",
             ],
             SITE_ID=1,
             MIDDLEWARE_CLASSES=(),
+            MIDDLEWARE=[
+                "django.contrib.sessions.middleware.SessionMiddleware",
+                "django.contrib.auth.middleware.AuthenticationMiddleware",
+                "django.contrib.messages.middleware.MessageMiddleware",
+            ],
+            TEMPLATES=[
+                {
+                    "BACKEND": "django.template.backends.django.DjangoTemplates",
+                    "APP_DIRS": True,
+                    "OPTIONS": {
+                        "context_processors": [
+                            "django.template.context_processors.request",
+                            "django.contrib.auth.context_processors.auth",
+                            "django.contrib.messages.context_processors.messages",
+                        ]
+                    },
+                }
+            ],
             TYPESENSE_ADMIN_API_KEY="M7aJZtlCecB5GF7y6iUxlvTY7zvC2usIlkZDKOX6Kw0",
             TYPESENSE_NODES=[
                 {"host": "localhost", "port": 8108, "protocol": "http"},
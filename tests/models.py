@@ -35,3 +35,16 @@ class Comment(models.Model):
 
     def __str__(self) -> str:
         return self.content
+
+
+class Store(models.Model):
+    name = models.CharField(max_length=255)
+    latitude = models.FloatField(null=True)
+    longitude = models.FloatField(null=True)
+
+    @property
+    def coordinates(self):
+        return None if self.latitude is None else (self.latitude, self.longitude)
+
+    def __str__(self) -> str:
+        return self.name
@@ -0,0 +1,101 @@
+from unittest import mock
+
+from django.contrib import admin
+from django.test import TestCase, RequestFactory
+from django.core.exceptions import ImproperlyConfigured
+
+from django_typesense import registry
+from django_typesense.admin import TypesenseSearchMixin, facet_filter
+
+from tests.models import Author, Post
+from tests.test_sharding import TenantPostCollection
+from tests.test_collection import PostCollection, AuthorCollection
+
+
+class PostAdmin(TypesenseSearchMixin, admin.ModelAdmin):
+    typesense_facets = ("title", "content")
+
+
+class TenantPostAdmin(TypesenseSearchMixin, admin.ModelAdmin):
+    def get_typesense_tenant(self, request):
+        return request.GET.get("author")
+
+
+class TypesenseSearchMixinTest(TestCase):
+    def setUp(self):
+        author = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+        self.posts = [Post.objects.create(title=f"Post {i}", content="...", author=author) for i in range(3)]
+
+        self.model_admin = PostAdmin(Post, admin.AdminSite())
+        self.factory = RequestFactory()
+
+        patcher = mock.patch.dict(registry._registry, {Post: PostCollection()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def search(self, result):
+        return mock.patch.object(PostCollection, "search", return_value=result)
+
+    def test_query_by_defaults_to_string_fields(self):
+        self.assertEqual(sorted(self.model_admin.get_typesense_query_by()), ["content", "title"])
+
+    def test_search_keeps_typesense_ranking(self):
+        ids = [str(self.posts[2].pk), str(self.posts[0].pk)]
+
+        with self.search({"hits": [{"document": {"id": pk}} for pk in ids]}) as search:
+            queryset, may_have_duplicates = self.model_admin.get_search_results(
+                self.factory.get("/", {"q": "post"}), Post.objects.all(), "post"
+            )
+
+        self.assertEqual([str(post.pk) for post in queryset], ids)
+        self.assertFalse(may_have_duplicates)
+        self.assertEqual(search.call_args.args[0]["q"], "post")
+
+    def test_empty_search_skips_typesense(self):
+        with self.search({}) as search:
+            queryset, _ = self.model_admin.get_search_results(self.factory.get("/"), Post.objects.all(), "")
+
+        search.assert_not_called()
+        self.assertEqual(queryset.count(), 3)
+
+    def test_facet_filter(self):
+        facet_counts = [
+            {"field_name": "title", "counts": [{"value": "Post 1", "count": 1}]},
+            {"field_name": "content", "counts": [{"value": "...", "count": 3}]},
+        ]
+        request = self.factory.get("/", {"title": "Post 1"})
+
+        with self.search({"facet_counts": facet_counts, "hits": []}) as search:
+            title_filter = facet_filter("title")(request, {"title": ["Post 1"]}, Post, self.model_admin)
+            content_filter = facet_filter("content")(request, {}, Post, self.model_admin)
+
+        search.assert_called_once()
+        self.assertEqual(search.call_args.args[0]["facet_by"], "title,content")
+        self.assertEqual(title_filter.lookup_choices, [("Post 1", "Post 1 (1)")])
+        self.assertEqual(content_filter.lookup_choices, [("...", "... (3)")])
+        self.assertEqual(list(title_filter.queryset(request, Post.objects.all())), [self.posts[1]])
+
+    def test_date_facets_are_rejected(self):
+        with mock.patch.dict(registry._registry, {Author: AuthorCollection()}):
+            model_admin = PostAdmin(Author, admin.AdminSite())
+
+            with self.assertRaises(AssertionError):
+                facet_filter("created_at")(self.factory.get("/"), {}, Author, model_admin)
+
+    def test_sharded_collection_needs_a_tenant(self):
+        request = self.factory.get("/", {"q": "post"})
+
+        with mock.patch.dict(registry._registry, {Post: TenantPostCollection()}):
+            with self.assertRaises(ImproperlyConfigured):
+                self.model_admin.get_search_results(request, Post.objects.all(), "post")
+
+    def test_sharded_collection_searches_the_tenant(self):
+        request = self.factory.get("/", {"q": "post", "author": "7"})
+        model_admin = TenantPostAdmin(Post, admin.AdminSite())
+
+        with mock.patch.dict(registry._registry, {Post: TenantPostCollection()}), mock.patch.object(
+            TenantPostCollection, "search", return_value={"hits": []}
+        ) as search:
+            model_admin.get_search_results(request, Post.objects.all(), "post")
+
+        self.assertEqual(search.call_args.kwargs["tenant"], "7")
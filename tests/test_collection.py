@@ -1,9 +1,14 @@
-from django.test import TestCase
+import gzip
+from unittest import mock
+
+from django.test import TestCase, override_settings
 
 from django_typesense import fields
+from django_typesense.client import import_client
 from django_typesense.collection import Collection
+from django_typesense.encoders import JSONEncoder
 
-from tests.models import Author, Post, Comment
+from tests.models import Author, Post, Store, Comment
 
 
 class AuthorCollection(Collection):
@@ -36,6 +41,31 @@ class CommentCollection(Collection):
         order_by = "created_at"
 
 
+class StoreCollection(Collection):
+    name = fields.StringField()
+    location = fields.GeoPointField(lat_source="latitude", lng_source="longitude", optional=True)
+
+    class Meta:
+        model = Store
+        name = "stores"
+
+
+class StoreLatitudeCollection(StoreCollection):
+    latitude = fields.FloatField(optional=True)
+
+    class Meta:
+        model = Store
+        name = "stores"
+
+
+class StoreCoordinatesCollection(Collection):
+    location = fields.GeoPointField(source="coordinates", optional=True)
+
+    class Meta:
+        model = Store
+        name = "stores"
+
+
 class CollectionTest(TestCase):
     def test_valid_schema_order_by(self):
         comment_collection = CommentCollection()
@@ -74,3 +104,70 @@ class CollectionTest(TestCase):
             expected_field = expected_fields[field["name"]]
             expected_field.update({"name": field["name"]})
             self.assertEqual(field, expected_field)
+
+    def test_to_document(self):
+        author = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+        document = AuthorCollection().to_document(author)
+
+        self.assertEqual(document["id"], str(author.pk))
+        self.assertEqual(document["email"], "jane@example.com")
+        self.assertEqual(document["website"], "https://example.com")
+        self.assertIsInstance(document["created_at"], int)
+
+    @override_settings(DJANGO_TYPESENSE_GZIP_IMPORTS=True)
+    @mock.patch("django_typesense.collection.import_client")
+    @mock.patch("django_typesense.collection.breaker")
+    def test_gzipped_import(self, breaker, import_client):
+        breaker.call.side_effect = lambda func, *args: b'{"success": true}'
+        author = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+
+        self.assertEqual(AuthorCollection().import_documents(), [])
+
+        func, body, _ = breaker.call.call_args.args
+        self.assertIs(func, import_client.collections["authors"].documents.import_)
+        self.assertEqual(JSONEncoder().decode_jsonl(gzip.decompress(body))[0]["id"], str(author.pk))
+
+    def test_import_client_sends_gzip_header(self):
+        self.assertEqual(import_client.config.additional_headers, {"Content-Encoding": "gzip"})
+
+    @mock.patch("django_typesense.collection.breaker")
+    def test_import_reads_geopoints_in_batch(self, breaker):
+        breaker.call.side_effect = lambda func, *args: b'{"success": true}\n{"success": true}'
+
+        paris = Store.objects.create(name="Paris", latitude=48.85, longitude=2.35)
+        nowhere = Store.objects.create(name="Nowhere")
+
+        with self.assertNumQueries(2):  # the stores & their geopoints
+            self.assertEqual(StoreCollection().import_documents(), [])
+
+        body = breaker.call.call_args.args[1]
+
+        self.assertEqual(
+            JSONEncoder().decode_jsonl(body),
+            [
+                {"id": str(paris.pk), "name": "Paris", "location": [48.85, 2.35]},
+                {"id": str(nowhere.pk), "name": "Nowhere"},
+            ],
+        )
+
+    @mock.patch("django_typesense.collection.breaker")
+    def test_import_loads_geo_columns_other_fields_read(self, breaker):
+        breaker.call.return_value = b""
+
+        for i in range(5):
+            Store.objects.create(name=f"Store {i}", latitude=48.85, longitude=2.35)
+
+        with self.assertNumQueries(2):
+            StoreLatitudeCollection().import_documents()
+
+        self.assertEqual(StoreLatitudeCollection()._get_deferrable_columns(), ("longitude",))
+
+    @mock.patch("django_typesense.collection.breaker")
+    def test_import_geopoints_from_properties(self, breaker):
+        breaker.call.return_value = b""
+        store = Store.objects.create(name="Paris", latitude=48.85, longitude=2.35)
+
+        StoreCoordinatesCollection().import_documents()
+
+        document = JSONEncoder().decode_jsonl(breaker.call.call_args.args[1])[0]
+        self.assertEqual(document, {"id": str(store.pk), "location": [48.85, 2.35]})
@@ -0,0 +1,97 @@
+from io import StringIO
+from unittest import mock
+
+from django.test import TestCase
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from typesense.exceptions import ObjectNotFound
+
+from django_typesense.curation import SYNONYM_KEYS, diff, sync_synonyms, sync_overrides, check_server_version
+from django_typesense.models import TypesenseSynonym, TypesenseOverride
+
+
+class CurationTest(TestCase):
+    def test_diff(self):
+        desired = {
+            "same": {"synonyms": ["a", "b"]},
+            "changed": {"synonyms": ["c", "d"], "root": "c"},
+            "new": {"synonyms": ["e", "f"]},
+        }
+        live = [
+            # Typesense fills in defaults we don't manage
+            {"id": "same", "synonyms": ["a", "b"], "root": "", "locale": ""},
+            {"id": "changed", "synonyms": ["c", "d"]},
+            {"id": "stale", "synonyms": ["g", "h"]},
+        ]
+
+        changes = diff(desired, live, SYNONYM_KEYS)
+
+        self.assertEqual(sorted(changes.upserts), ["changed", "new"])
+        self.assertEqual(changes.deletes, ["stale"])
+
+    @mock.patch("django_typesense.curation.client")
+    def test_sync_synonyms(self, client):
+        TypesenseSynonym.objects.create(collection="posts", synonym_id="colors", synonyms="red, blue,green")
+        synonyms = client.collections["posts"].synonyms
+        synonyms.retrieve.return_value = {"synonyms": [{"id": "stale", "synonyms": ["a", "b"]}]}
+
+        changes = sync_synonyms("posts", workers=2)
+
+        synonyms.retrieve.assert_called_once_with()
+        synonyms.upsert.assert_called_once_with("colors", {"synonyms": ["red", "blue", "green"]})
+        synonyms.__getitem__.assert_called_once_with("stale")
+        synonyms["stale"].delete.assert_called_once_with()
+        self.assertEqual(changes.deletes, ["stale"])
+
+    @mock.patch("django_typesense.curation.client")
+    def test_sync_overrides_skips_unchanged(self, client):
+        override = TypesenseOverride.objects.create(
+            collection="posts", override_id="pin", query="django", includes=[{"id": "1", "position": 1}]
+        )
+        overrides = client.collections["posts"].overrides
+        overrides.retrieve.return_value = {
+            "overrides": [{"id": "pin", "stop_processing": True, **override.to_typesense_schema()}]
+        }
+
+        changes = sync_overrides("posts")
+
+        overrides.upsert.assert_not_called()
+        self.assertEqual(changes.deletes, [])
+
+    @mock.patch("django_typesense.curation.client")
+    def test_check_server_version(self, client):
+        client.debug.retrieve.return_value = {"state": 1, "version": "29.0"}
+        check_server_version()
+
+        client.debug.retrieve.return_value = {"state": 1, "version": "30.0.rc12"}
+        with self.assertRaises(ImproperlyConfigured):
+            check_server_version()
+
+    @mock.patch("django_typesense.curation.client")
+    def test_command_skips_missing_collections(self, client):
+        client.debug.retrieve.return_value = {"state": 1, "version": "29.0"}
+        TypesenseSynonym.objects.create(collection="missing", synonym_id="colors", synonyms="red,blue")
+        TypesenseSynonym.objects.create(collection="posts", synonym_id="colors", synonyms="red,blue")
+
+        def get_collection(name):
+            collection = mock.MagicMock()
+            if name == "missing":
+                collection.synonyms.retrieve.side_effect = ObjectNotFound(404, "Not Found")
+            return collection
+
+        client.collections.__getitem__.side_effect = get_collection
+        stdout = StringIO()
+
+        call_command("sync_curations", stdout=stdout)
+
+        self.assertIn("missing: skipped", stdout.getvalue())
+        self.assertIn("posts: 1 synonyms upserted", stdout.getvalue())
+
+    @mock.patch("django_typesense.curation.client")
+    def test_command_fails_on_typesense_30(self, client):
+        client.debug.retrieve.return_value = {"state": 1, "version": "30.0"}
+
+        with self.assertRaises(CommandError):
+            call_command("sync_curations", stdout=StringIO())
+
+        client.collections.__getitem__.assert_not_called()
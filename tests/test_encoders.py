@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase, override_settings
+
+from django_typesense.encoders import JSONEncoder, get_encoder
+
+
+class EncoderTest(SimpleTestCase):
+    def test_encode_jsonl_reuses_buffer(self):
+        encoder = JSONEncoder()
+        buffer = encoder.encode_jsonl([{"id": "1", "title": "ünïcode"}, {"id": "2"}])
+
+        self.assertEqual(bytes(buffer), '{"id":"1","title":"ünïcode"}\n{"id":"2"}\n'.encode())
+
+        same_buffer = encoder.encode_jsonl([{"id": "3"}], buffer)
+
+        self.assertIs(same_buffer, buffer)
+        self.assertEqual(bytes(buffer), b'{"id":"3"}\n')
+
+    def test_decode_jsonl(self):
+        encoder = JSONEncoder()
+        results = encoder.decode_jsonl(b'{"success":true}\n{"success":false,"error":"x"}\n')
+
+        self.assertEqual(results, [{"success": True}, {"success": False, "error": "x"}])
+
+    @override_settings(DJANGO_TYPESENSE_DOCUMENT_ENCODER="django_typesense.encoders.JSONEncoder")
+    def test_get_encoder_from_settings(self):
+        self.assertIsInstance(get_encoder(), JSONEncoder)
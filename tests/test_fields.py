@@ -0,0 +1,86 @@
+import struct
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from django_typesense import fields
+from django_typesense.search import vector_query, geo_radius_filter, geo_sort
+from django_typesense.encoders import JSONEncoder, get_encoder
+
+
+class VectorFieldTest(SimpleTestCase):
+    def test_schema(self):
+        field = fields.VectorField(num_dim=3, distance="ip")
+
+        self.assertEqual(
+            field.to_typesense_field_objs("embedding"),
+            (
+                {
+                    "name": "embedding",
+                    "type": "float[]",
+                    "facet": False,
+                    "index": True,
+                    "optional": False,
+                    "num_dim": 3,
+                    "vec_dist": "ip",
+                },
+            ),
+        )
+
+    def test_from_bytes(self):
+        field = fields.VectorField(num_dim=3, name="embedding")
+        vector = field.from_value(memoryview(struct.pack("<3f", 0.5, 1.0, -2.0)))
+
+        for encoder in (JSONEncoder(), get_encoder()):
+            self.assertEqual(encoder.dumps({"embedding": vector}), b'{"embedding":[0.5,1.0,-2.0]}')
+
+    def test_wrong_dimensions(self):
+        field = fields.VectorField(num_dim=4, name="embedding")
+
+        with self.assertRaises(ValueError):
+            field.from_value([0.5, 1.0, -2.0])
+
+    def test_vector_query(self):
+        self.assertEqual(
+            vector_query("embedding", [0.5, 1.0], k=5, distance_threshold=0.3),
+            "embedding:([0.5,1.0], k:5, distance_threshold:0.3)",
+        )
+
+
+class GeoPointFieldTest(SimpleTestCase):
+    def test_schema(self):
+        field = fields.GeoPointField(lat_source="latitude", lng_source="longitude")
+
+        self.assertEqual(field.to_typesense_field_objs("location")[0]["type"], "geopoint")
+        self.assertEqual(field.sources, ("latitude", "longitude"))
+
+    def test_value_from_two_sources(self):
+        field = fields.GeoPointField(name="location", lat_source="latitude", lng_source="longitude")
+        place = SimpleNamespace(latitude=48.85, longitude=2.35)
+
+        self.assertEqual(field.from_value(field.value_from_instance(place, "location")), [48.85, 2.35])
+        self.assertIsNone(field.value_from_instance(SimpleNamespace(latitude=None, longitude=2.35), "location"))
+
+    def test_value_from_point(self):
+        field = fields.GeoPointField(name="location")
+
+        self.assertEqual(field.from_value(SimpleNamespace(x=2.35, y=48.85)), [48.85, 2.35])
+
+    def test_out_of_range(self):
+        field = fields.GeoPointField(name="location")
+
+        with self.assertRaises(ValueError):
+            field.from_value((91.0, 0.0))
+
+        with self.assertRaises(ValueError):
+            field.from_values([(48.85, 2.35), (0.0, 181.0)])
+
+    def test_from_values(self):
+        field = fields.GeoPointField(name="location")
+        pairs = field.from_values([(48.85, 2.35), (SimpleNamespace(x=-0.12, y=51.5),)])
+
+        self.assertEqual(get_encoder().dumps(list(pairs)), b"[[48.85,2.35],[51.5,-0.12]]")
+
+    def test_search_helpers(self):
+        self.assertEqual(geo_radius_filter("location", 48.85, 2.35, 5), "location:(48.85, 2.35, 5 km)")
+        self.assertEqual(geo_sort("location", 48.85, 2.35), "location(48.85, 2.35):asc")
@@ -0,0 +1,158 @@
+import time
+import threading
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+from typesense.exceptions import ObjectNotFound, ServiceUnavailable
+
+from django_typesense.routing import NodeStats, ReadRouter
+
+
+NODES = [
+    {"host": "node-a", "port": 8108, "protocol": "http"},
+    {"host": "node-b", "port": 8108, "protocol": "http"},
+    {"host": "node-c", "port": 8108, "protocol": "http"},
+]
+
+
+def fake_client(host, delay=0.0, error=None):
+    def search(params):
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return {"found": 1, "node": host, "thread": threading.current_thread().name, "method": "GET"}
+
+    def perform(search_queries, common_params=None):
+        return {"results": [{"found": 1, "node": host, "method": "POST", **search_queries["searches"][0]}]}
+
+    documents = SimpleNamespace(search=search)
+    return SimpleNamespace(
+        collections={"posts": SimpleNamespace(documents=documents)}, multi_search=SimpleNamespace(perform=perform)
+    )
+
+
+class NodeStatsTest(SimpleTestCase):
+    def test_ewma_and_p95(self):
+        stats = NodeStats(NODES[0], alpha=0.5)
+
+        self.assertIsNone(stats.p95())
+
+        for seconds in (0.1, 0.3):
+            stats.observe(seconds)
+
+        self.assertAlmostEqual(stats.ewma, 0.2)
+        self.assertEqual(stats.p95(), 0.3)
+
+    def test_mark_unhealthy(self):
+        stats = NodeStats(NODES[0])
+        stats.mark_unhealthy(60)
+
+        self.assertFalse(stats.healthy)
+
+        stats.observe(0.1)
+
+        self.assertTrue(stats.healthy)
+
+
+class ReadRouterTest(SimpleTestCase):
+    @override_settings(TYPESENSE_READ_PROBE_RATE=0)
+    def test_prefers_fastest_node(self):
+        router = ReadRouter(NODES[:2])
+        router.stats[0].observe(0.5)
+        router.stats[1].observe(0.01)
+        router.clients = [fake_client("node-a"), fake_client("node-b")]
+
+        self.assertEqual(router.ranked(), [1, 0])
+        self.assertEqual(router.search("posts", {"q": "*"})["node"], "node-b")
+
+    @override_settings(TYPESENSE_READ_PROBE_RATE=0)
+    def test_spreads_load_over_two_choices(self):
+        router = ReadRouter(NODES)
+
+        for index, seconds in enumerate((0.01, 0.02, 0.5)):
+            router.stats[index].observe(seconds)
+
+        primaries = {router.ranked()[0] for _ in range(200)}
+
+        self.assertEqual(primaries, {0, 1})
+
+    @override_settings(TYPESENSE_READ_PROBE_RATE=1)
+    def test_probes_slow_nodes(self):
+        router = ReadRouter(NODES)
+
+        for index, seconds in enumerate((0.01, 0.02, 0.5)):
+            router.stats[index].observe(seconds)
+
+        primaries = {router.ranked()[0] for _ in range(200)}
+
+        self.assertEqual(primaries, {0, 1, 2})
+
+    def test_fails_over_and_marks_unhealthy(self):
+        router = ReadRouter(NODES[:2])
+        router.stats[1].observe(0.5)
+        router.clients = [fake_client("node-a", error=ServiceUnavailable()), fake_client("node-b")]
+
+        self.assertEqual(router.search("posts", {"q": "*"})["node"], "node-b")
+        self.assertFalse(router.stats[0].healthy)
+        self.assertEqual(router.ranked(), [1, 0])
+
+    def test_request_errors_do_not_fail_over(self):
+        router = ReadRouter(NODES[:2])
+        router.clients = [fake_client("node-a", error=ObjectNotFound()), fake_client("node-b")]
+
+        with self.assertRaises(ObjectNotFound):
+            router.search("posts", {"q": "*"})
+
+        self.assertTrue(router.stats[0].healthy)
+
+    @override_settings(TYPESENSE_HEDGED_READS=True, TYPESENSE_HEDGE_DELAY_SECONDS=0.01)
+    def test_hedged_search_takes_first_reply(self):
+        router = ReadRouter(NODES[:2])
+        router.clients = [fake_client("node-a", delay=0.5), fake_client("node-b")]
+
+        self.assertEqual(router.search("posts", {"q": "*"})["node"], "node-b")
+
+    @override_settings(TYPESENSE_HEDGED_READS=True, TYPESENSE_HEDGE_WORKERS=1)
+    def test_busy_pool_searches_on_calling_thread(self):
+        router = ReadRouter(NODES[:2])
+        router.clients = [fake_client("node-a"), fake_client("node-b")]
+        router._free_workers.acquire()
+
+        result = router.search("posts", {"q": "*"})
+
+        self.assertEqual(result["thread"], threading.current_thread().name)
+
+    @override_settings(TYPESENSE_HEDGED_READS=True, TYPESENSE_HEDGE_WORKERS=1, TYPESENSE_HEDGE_DELAY_SECONDS=0.01)
+    def test_hedge_is_dropped_without_a_free_worker(self):
+        router = ReadRouter(NODES[:2])
+        router.clients = [fake_client("node-a", delay=0.1), fake_client("node-b")]
+
+        self.assertEqual(router.search("posts", {"q": "*"})["node"], "node-a")
+
+    def test_vector_and_large_searches_are_posted(self):
+        router = ReadRouter(NODES[:1])
+        router.clients = [fake_client("node-a")]
+
+        self.assertEqual(router.search("posts", {"q": "*"})["method"], "GET")
+
+        result = router.search("posts", {"q": "*", "vector_query": "embedding:([0.1, 0.2], k:10)"})
+        self.assertEqual((result["method"], result["collection"]), ("POST", "posts"))
+
+        self.assertEqual(router.search("posts", {"q": "*", "filter_by": "id:" * 2000})["method"], "POST")
+
+    def test_posted_search_errors_are_raised(self):
+        router = ReadRouter(NODES[:2])
+        router.clients = [fake_client("node-a"), fake_client("node-b")]
+        router.clients[0].multi_search.perform = lambda *args: {"results": [{"error": "Not found.", "code": 404}]}
+
+        with self.assertRaises(ObjectNotFound):
+            router._search(0, "posts", {"q": "*", "vector_query": "embedding:([], k:10)"})
+
+        self.assertTrue(router.stats[0].healthy)
+
+        router.clients[0].multi_search.perform = lambda *args: {"results": [{"error": "Oops.", "code": 503}]}
+
+        result = router.search("posts", {"q": "*", "vector_query": "embedding:([], k:10)"})
+
+        self.assertEqual(result["node"], "node-b")
+        self.assertFalse(router.stats[0].healthy)
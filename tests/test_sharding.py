@@ -0,0 +1,207 @@
+from io import StringIO
+from unittest import mock
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from typesense.exceptions import ObjectAlreadyExists
+
+from django_typesense import fields
+
+from django_typesense import registry
+from django_typesense.collection import Collection
+from django_typesense.curation import get_curated_collections
+from django_typesense.models import TypesenseSynonym
+
+from tests.models import Author, Post
+
+
+class TenantPostCollection(Collection):
+    title = fields.StringField()
+    author_id = fields.IntegerField(source="author_id")
+
+    class Meta:
+        model = Post
+        name = "tenant_posts"
+        shard_by = "author"
+
+
+class HashedPostCollection(Collection):
+    title = fields.StringField()
+
+    class Meta:
+        model = Post
+        name = "hashed_posts"
+        shard_by = "author"
+        shards = 4
+        shard_placement = {1: "big"}
+
+
+class ShardingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.jane = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+        self.john = Author.objects.create(name="John", email="john@example.com", website="https://example.com")
+
+    def create_post(self, author: Author) -> Post:
+        with mock.patch.dict(registry._registry, clear=True):
+            return Post.objects.create(title="Hello", content="World", author=author)
+
+    def test_shards(self):
+        collection = HashedPostCollection()
+
+        self.assertEqual(collection.get_shard(1), "big")
+        self.assertIn(collection.get_shard(2), {"0", "1", "2", "3"})
+        self.assertEqual(collection.get_shard(2), collection.get_shard(2))
+        self.assertEqual(collection.get_shards(), ["0", "1", "2", "3", "big"])
+        self.assertEqual(TenantPostCollection().get_shard(7), "7")
+
+    def test_collection_names(self):
+        collection = TenantPostCollection()
+        post = self.create_post(self.jane)
+
+        self.assertEqual(collection.get_collection_name_for(post), f"tenant_posts__{self.jane.pk}")
+        self.assertEqual(collection.to_typesense_schema("7")["name"], "tenant_posts__7")
+
+        with self.assertRaises(AssertionError):
+            collection.get_collection_name()
+
+    @mock.patch("django_typesense.collection.client")
+    def test_per_tenant_shards_are_cached(self, client):
+        client.collections.retrieve.return_value = [{"name": "tenant_posts__1"}, {"name": "posts"}]
+        collection = TenantPostCollection()
+
+        self.assertEqual(collection.get_shards(), ["1"])
+        self.assertEqual(collection.get_shards(), ["1"])
+        client.collections.retrieve.assert_called_once()
+
+    def test_tenants_by_shard(self):
+        self.create_post(self.jane)
+        self.create_post(self.jane)
+        self.create_post(self.john)
+
+        self.assertEqual(
+            TenantPostCollection().get_tenants_by_shard(),
+            {str(self.jane.pk): [self.jane.pk], str(self.john.pk): [self.john.pk]},
+        )
+
+    @mock.patch("django_typesense.collection.read_router")
+    def test_search_is_routed_and_scoped(self, read_router):
+        TenantPostCollection().search({"q": "hello", "filter_by": "title:hello"}, tenant=7)
+
+        read_router.search.assert_called_once_with(
+            "tenant_posts__7", {"q": "hello", "filter_by": "(title:hello) && author_id:=7"}
+        )
+
+        with self.assertRaises(AssertionError):
+            TenantPostCollection().search({"q": "hello"})
+
+    @mock.patch("django_typesense.collection.client")
+    def test_scoped_search_key(self, client):
+        client.keys.generate_scoped_search_key.return_value = "scoped"
+
+        collection_name, key = TenantPostCollection().generate_scoped_search_key("search", 7)
+
+        self.assertEqual((collection_name, key), ("tenant_posts__7", "scoped"))
+        client.keys.generate_scoped_search_key.assert_called_once_with("search", {"filter_by": "author_id:=7"})
+
+    @mock.patch("django_typesense.collection.client")
+    def test_shared_shards_need_the_tenant_indexed(self, client):
+        # HashedPostCollection doesn't index author_id - a scoped key would see every tenant of the shard.
+        with self.assertRaises(ValueError):
+            HashedPostCollection().generate_scoped_search_key("search", 7)
+
+        client.keys.generate_scoped_search_key.assert_not_called()
+
+    @mock.patch("django_typesense.collection.breaker")
+    @mock.patch("django_typesense.collection.client")
+    def test_import_groups_by_shard(self, client, breaker):
+        breaker.call.side_effect = lambda func, *args: b'{"success": true}'
+
+        self.create_post(self.jane)
+        self.create_post(self.john)
+        self.create_post(self.jane)
+
+        self.assertEqual(TenantPostCollection().import_documents(), [])
+
+        imported = [c.args[0] for c in client.collections.__getitem__.call_args_list]
+        self.assertEqual(sorted(imported), [f"tenant_posts__{self.jane.pk}", f"tenant_posts__{self.john.pk}"])
+
+    def test_tenant_move(self):
+        post = self.create_post(self.jane)
+
+        with mock.patch.dict(registry._registry, {Post: TenantPostCollection()}):
+            post = Post.objects.get(pk=post.pk)
+
+            with mock.patch.object(Collection, "delete_document") as delete, mock.patch.object(
+                Collection, "upsert_document"
+            ) as upsert, self.captureOnCommitCallbacks(execute=True):
+                post.author = self.john
+                post.save()
+
+        delete.assert_called_once_with(post.pk, f"tenant_posts__{self.jane.pk}")
+        upsert.assert_called_once_with(post, f"tenant_posts__{self.john.pk}")
+
+    def test_unsaved_tenant_change_is_not_a_move(self):
+        post = self.create_post(self.jane)
+
+        with mock.patch.dict(registry._registry, {Post: TenantPostCollection()}):
+            post = Post.objects.get(pk=post.pk)
+
+            with mock.patch.object(Collection, "delete_document") as delete, mock.patch.object(
+                Collection, "update_document"
+            ) as update, self.captureOnCommitCallbacks(execute=True):
+                post.author = self.john
+                post.title = "Hello again"
+                post.save(update_fields=["title"])
+
+            delete.assert_not_called()
+            update.assert_called_once_with(post, ["title"], f"tenant_posts__{self.jane.pk}")
+
+            # The snapshot keeps the saved tenant, so saving it now is a move.
+            with mock.patch.object(Collection, "delete_document") as delete, mock.patch.object(
+                Collection, "upsert_document"
+            ) as upsert, self.captureOnCommitCallbacks(execute=True):
+                post.save()
+
+            delete.assert_called_once_with(post.pk, f"tenant_posts__{self.jane.pk}")
+            upsert.assert_called_once_with(post, f"tenant_posts__{self.john.pk}")
+
+    @mock.patch("django_typesense.curation.client")
+    def test_curated_shards(self, client):
+        TypesenseSynonym.objects.create(collection="hashed_posts", synonym_id="colors", synonyms="red,blue")
+        # Hashed shards nothing was imported into yet don't exist.
+        client.collections.retrieve.return_value = [{"name": "hashed_posts__0"}, {"name": "hashed_posts__big"}]
+
+        with mock.patch.dict(registry._registry, {Post: HashedPostCollection()}, clear=True):
+            pairs = get_curated_collections()
+
+        self.assertEqual(pairs, [("hashed_posts__0", "hashed_posts"), ("hashed_posts__big", "hashed_posts")])
+
+    @mock.patch("django_typesense.curation.sync_overrides")
+    @mock.patch("django_typesense.curation.sync_synonyms")
+    @mock.patch("django_typesense.collection.client")
+    def test_created_shards_get_the_curations(self, client, sync_synonyms, sync_overrides):
+        TypesenseSynonym.objects.create(collection="hashed_posts", synonym_id="colors", synonyms="red,blue")
+
+        HashedPostCollection().create_collection("2", recreate=True)
+
+        sync_synonyms.assert_called_once_with("hashed_posts__2", source="hashed_posts")
+        sync_overrides.assert_not_called()
+
+        client.collections.create.side_effect = ObjectAlreadyExists()
+        HashedPostCollection().create_collection("2")
+
+        sync_synonyms.assert_called_once()
+
+    def test_index_command(self):
+        self.create_post(self.jane)
+        self.create_post(self.john)
+
+        with mock.patch.dict(registry._registry, {Post: TenantPostCollection()}, clear=True), mock.patch.object(
+            Collection, "index", return_value=[]
+        ) as index:
+            call_command("index", "--tenant", str(self.jane.pk), "--recreate", stdout=StringIO())
+
+        index.assert_called_once_with(str(self.jane.pk), tenants=[self.jane.pk], recreate=True, batch_size=None)
@@ -0,0 +1,182 @@
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.test import TestCase, SimpleTestCase
+from django.core.management import CommandError, call_command
+from typesense.exceptions import ObjectNotFound, ServiceUnavailable
+
+from django_typesense import registry
+from django_typesense.spill import SpillLog
+from django_typesense.breaker import CircuitBreaker, CircuitOpenError
+
+from tests.models import Author, Post
+from tests.test_collection import PostCollection
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    def fail(self):
+        raise ServiceUnavailable()
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        for _ in range(2):
+            with self.assertRaises(ServiceUnavailable):
+                breaker.call(self.fail)
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            breaker.call(lambda: "never called")
+
+    def test_half_open_trial_closes_breaker(self):
+        closed = []
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.on_close(lambda: closed.append(True))
+
+        with self.assertRaises(ServiceUnavailable):
+            breaker.call(self.fail)
+
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(closed, [True])
+
+    def test_request_errors_do_not_trip(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        def not_found():
+            raise ObjectNotFound()
+
+        with self.assertRaises(ObjectNotFound):
+            breaker.call(not_found)
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class SpillLogTest(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.spill_log = SpillLog(self.directory.name)
+
+    def tearDown(self):
+        self.spill_log.rotate()
+        self.directory.cleanup()
+
+    def test_replay_deduplicates_and_removes_segments(self):
+        self.spill_log.append("posts", "upsert", [{"id": "1", "title": "a"}, {"id": "2", "title": "b"}])
+        self.spill_log.append("posts", "update", [{"id": "1", "title": "c"}])
+        self.spill_log.append("posts", "delete", [{"id": "2"}])
+
+        with mock.patch.object(SpillLog, "_apply", return_value=[]) as apply:
+            self.spill_log.replay()
+
+        apply.assert_called_once_with({"posts": ["1", "2"]})
+        self.assertEqual(self.spill_log.segments(), [])
+
+    def test_appends_are_flushed_and_fsynced_on_a_timer(self):
+        self.spill_log = SpillLog(self.directory.name, fsync_interval=0.01)
+
+        with mock.patch("django_typesense.spill.os.fsync") as fsync:
+            self.spill_log.append("posts", "upsert", [{"id": "1"}])
+
+            # Flushed to the OS right away, so a killed process doesn't lose it.
+            self.assertGreater(self.spill_log.segments()[0].stat().st_size, 0)
+
+            self.spill_log._timer.join()
+
+        fsync.assert_called_once()
+        self.assertIsNone(self.spill_log._timer)
+
+    def test_torn_record_is_dropped(self):
+        self.spill_log.append("posts", "upsert", [{"id": "1"}, {"id": "2"}])
+        self.spill_log.rotate()
+
+        segment = self.spill_log.segments()[0]
+        segment.write_bytes(segment.read_bytes()[:-3])
+
+        with mock.patch.object(SpillLog, "_apply", return_value=[]) as apply:
+            self.spill_log.replay()
+
+        self.assertEqual(apply.call_args.args[0], {"posts": ["1"]})
+
+    def test_failed_replay_keeps_segments(self):
+        self.spill_log.append("posts", "upsert", [{"id": "1"}])
+
+        with mock.patch.object(SpillLog, "_apply", side_effect=ServiceUnavailable()):
+            with self.assertRaises(ServiceUnavailable):
+                self.spill_log.replay()
+
+        self.assertEqual(len(self.spill_log.segments()), 1)
+
+
+class SpillReplayTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.spill_log = SpillLog(self.directory.name)
+        self.author = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+
+    @mock.patch("django_typesense.spill.client")
+    def test_documents_are_rebuilt_from_the_database(self, client):
+        post = Post.objects.create(title="Old", content="World", author=self.author)
+        self.spill_log.append("posts", "upsert", [{"id": str(post.pk), "title": "Old"}])
+        self.spill_log.append("posts", "upsert", [{"id": "404", "title": "Gone"}])
+
+        # Saved again (and sent) after the outage - replay must not undo it.
+        Post.objects.filter(pk=post.pk).update(title="New")
+
+        documents = client.collections.__getitem__.return_value.documents
+        documents.import_.return_value = b'{"success": true}'
+
+        with mock.patch.dict(registry._registry, {Post: PostCollection()}):
+            self.assertEqual(self.spill_log.replay(), [])
+
+        self.assertIn(b'"title":"New"', documents.import_.call_args.args[0])
+        documents.delete.assert_called_once_with({"filter_by": "id:[404]"})
+
+
+class SpilledWritesTest(TestCase):
+    def setUp(self):
+        self.author = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+
+        with mock.patch.dict(registry._registry, clear=True):
+            self.post = Post.objects.create(title="Hello", content="World", author=self.author)
+
+    @mock.patch("django_typesense.spill.get_spill_log")
+    @mock.patch("django_typesense.collection.breaker")
+    def test_only_outages_are_spilled(self, breaker, get_spill_log):
+        breaker.call.side_effect = ServiceUnavailable()
+
+        PostCollection().upsert_document(self.post)
+
+        get_spill_log.return_value.append.assert_called_once()
+
+        # A bug on our side must not be hidden in the spill log.
+        breaker.call.side_effect = TypeError()
+
+        with self.assertRaises(TypeError):
+            PostCollection().upsert_document(self.post)
+
+        get_spill_log.return_value.append.assert_called_once()
+
+    @mock.patch("django_typesense.spill.get_spill_log")
+    @mock.patch("django_typesense.collection.breaker")
+    def test_spilled_imports_are_reported(self, breaker, get_spill_log):
+        breaker.call.side_effect = CircuitOpenError()
+
+        failures = PostCollection().import_documents()
+
+        self.assertEqual(failures, [mock.ANY])
+        self.assertEqual((failures[0]["id"], failures[0]["spilled"]), (str(self.post.pk), True))
+
+        stdout = StringIO()
+
+        with mock.patch.dict(registry._registry, {Post: PostCollection()}, clear=True), mock.patch(
+            "django_typesense.collection.client"
+        ), self.assertRaises(CommandError):
+            call_command("index", stdout=stdout)
+
+        self.assertIn("posts: 0 failed, 1 spilled", stdout.getvalue())
@@ -0,0 +1,243 @@
+from unittest import mock
+
+from django.db.models import Q
+from django.test import TestCase
+from django.db import IntegrityError, transaction
+from typesense.exceptions import ServiceUnavailable
+
+from django_typesense import fields
+
+from django_typesense import registry
+from django_typesense.collection import Collection
+
+from tests.models import Author, Post
+from tests.test_collection import PostCollection
+
+
+class PublishedPostCollection(Collection):
+    title = fields.StringField()
+
+    class Meta:
+        model = Post
+        name = "published_posts"
+        filter = Q(published=True)
+
+
+class SyncTest(TestCase):
+    collection_class = PostCollection
+
+    def setUp(self):
+        self.author = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+
+        patcher = mock.patch.dict(registry._registry, {Post: self.collection_class()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Run the syncs right away instead of when the test's transaction commits.
+        patcher = mock.patch("django_typesense.signals.transaction.on_commit", lambda func, using=None: func())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.writes = mock.Mock()
+
+        for method in ("upsert_document", "update_document", "delete_document"):
+            patcher = mock.patch.object(Collection, method, getattr(self.writes, method))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_post(self, **kwargs) -> Post:
+        post = Post.objects.create(title="Hello", content="World", author=self.author, **kwargs)
+        self.writes.reset_mock()
+        return Post.objects.get(pk=post.pk)
+
+    def test_create_upserts(self):
+        post = Post.objects.create(title="Hello", content="World", author=self.author)
+
+        self.writes.upsert_document.assert_called_once_with(post, self.collection_class.Meta.name)
+
+    def test_save_without_indexed_changes_is_skipped(self):
+        post = self.create_post()
+        post.published = True
+        post.save()
+
+        self.assertEqual(self.writes.mock_calls, [])
+
+    def test_save_sends_changed_fields_only(self):
+        post = self.create_post()
+        post.title = "Hello again"
+        post.save()
+
+        self.writes.update_document.assert_called_once_with(post, ["title"], self.collection_class.Meta.name)
+
+        # the snapshot is refreshed after every sync
+        self.writes.reset_mock()
+        post.save()
+
+        self.assertEqual(self.writes.mock_calls, [])
+
+    def test_save_with_update_fields(self):
+        post = self.create_post()
+        post.title = "Hello again"
+        post.save(update_fields=["published"])
+
+        self.assertEqual(self.writes.mock_calls, [])
+
+        post.save(update_fields=["title", "content"])
+
+        self.writes.update_document.assert_called_once_with(post, ["title"], self.collection_class.Meta.name)
+
+    def test_deferred_fields(self):
+        self.create_post()
+        post = Post.objects.only("title").get()
+        post.content = "Changed"
+        post.save()
+
+        self.writes.update_document.assert_called_once_with(post, ["content"], self.collection_class.Meta.name)
+
+    def test_constructed_instance_saved_over_existing_row(self):
+        post = self.create_post(published=True)
+        post = Post(
+            pk=post.pk, title="Changed", content="World", author=self.author, published=True, created_at=post.created_at
+        )
+        post.save()
+
+        self.writes.upsert_document.assert_called_once_with(post, self.collection_class.Meta.name)
+
+    def test_delete(self):
+        post = self.create_post()
+        pk = post.pk
+        post.delete()
+
+        self.writes.delete_document.assert_called_once_with(pk, self.collection_class.Meta.name)
+
+    def test_partial_document(self):
+        post = self.create_post()
+
+        self.assertEqual(PostCollection().to_document(post, ["title"]), {"id": str(post.pk), "title": "Hello"})
+
+
+class TransactionSyncTest(TestCase):
+    def setUp(self):
+        self.author = Author.objects.create(name="Jane", email="jane@example.com", website="https://example.com")
+
+        patcher = mock.patch.dict(registry._registry, {Post: PostCollection()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch.object(Collection, "upsert_document")
+    def test_sync_waits_for_commit(self, upsert):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = Post.objects.create(title="Hello", content="World", author=self.author)
+            upsert.assert_not_called()
+
+        upsert.assert_called_once_with(post, "posts")
+
+    @mock.patch.object(Collection, "upsert_document")
+    def test_rolled_back_save_is_not_synced(self, upsert):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                Post.objects.create(title="Hello", content="World", author=self.author)
+                raise IntegrityError()
+
+        upsert.assert_not_called()
+
+    @mock.patch.object(Collection, "upsert_document", side_effect=ServiceUnavailable())
+    def test_errors_are_logged_not_raised(self, upsert):
+        with self.assertLogs("django_typesense.signals", "ERROR"), self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(title="Hello", content="World", author=self.author)
+
+        upsert.assert_called_once()
+
+
+class FilteredSyncTest(SyncTest):
+    collection_class = PublishedPostCollection
+
+    def test_queryset_is_filtered(self):
+        self.create_post(published=True)
+        self.create_post(published=False)
+
+        self.assertEqual(list(PublishedPostCollection().get_queryset().values_list("published", flat=True)), [True])
+
+    @mock.patch("django_typesense.collection.client")
+    @mock.patch("django_typesense.collection.breaker")
+    def test_imported_queryset_is_filtered(self, breaker, client):
+        breaker.call.side_effect = lambda func, *args: b'{"success": true}'
+        published = self.create_post(published=True)
+        draft = self.create_post(published=False)
+
+        PublishedPostCollection().import_documents(Post.objects.all())
+
+        body = breaker.call.call_args.args[1].decode()
+        self.assertIn(f'"id":"{published.pk}"', body)
+        self.assertNotIn(f'"id":"{draft.pk}"', body)
+
+        # Explicit iterables are imported as-is.
+        PublishedPostCollection().import_documents([draft])
+
+        self.assertIn(f'"id":"{draft.pk}"', breaker.call.call_args.args[1].decode())
+
+    def test_create_not_matching(self):
+        Post.objects.create(title="Hello", content="World", author=self.author)
+
+        self.assertEqual(self.writes.mock_calls, [])
+
+    def test_create_upserts(self):
+        post = Post.objects.create(title="Hello", content="World", author=self.author, published=True)
+
+        self.writes.upsert_document.assert_called_once_with(post, self.collection_class.Meta.name)
+
+    def test_save_sends_changed_fields_only(self):
+        post = self.create_post(published=True)
+        post.title = "Hello again"
+        post.save()
+
+        self.writes.update_document.assert_called_once_with(post, ["title"], self.collection_class.Meta.name)
+
+    def test_save_with_update_fields(self):
+        post = self.create_post(published=True)
+        post.title = "Hello again"
+        post.save(update_fields=["content"])
+
+        self.assertEqual(self.writes.mock_calls, [])
+
+        post.save(update_fields=["title"])
+
+        self.writes.update_document.assert_called_once_with(post, ["title"], self.collection_class.Meta.name)
+
+    def test_deferred_fields(self):
+        self.create_post(published=True)
+        post = Post.objects.only("content").get()
+        post.title = "Changed"
+        post.save()
+
+        self.writes.update_document.assert_called_once_with(post, ["title"], self.collection_class.Meta.name)
+
+    def test_not_matching_changes_are_skipped(self):
+        post = self.create_post()
+        post.title = "Hello again"
+
+        with self.assertNumQueries(2):  # the update & the filter check
+            post.save()
+
+        self.assertEqual(self.writes.mock_calls, [])
+
+    def test_start_and_stop_matching(self):
+        post = self.create_post()
+        post.published = True
+        post.save()
+
+        self.writes.upsert_document.assert_called_once_with(post, self.collection_class.Meta.name)
+
+        post.published = False
+        post.save()
+
+        self.writes.delete_document.assert_called_once_with(post.pk, "published_posts")
+
+    def test_save_without_indexed_changes_is_skipped(self):
+        post = self.create_post(published=True)
+        post.content = "Not indexed"
+
+        with self.assertNumQueries(1):
+            post.save()
+
+        self.assertEqual(self.writes.mock_calls, [])